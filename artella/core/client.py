@@ -48,6 +48,7 @@ class ArtellaDriveClient(object):
         self._remote_sessions = list()  # Contains list of available remote sessions.
         self._local_projects = dict()   # Contains dictionary of all available user local Artella projects.
         self._remote_projects = dict()  # Contains a dictionary of all available user remote Artella projects.
+        self._projects_sessions = dict()  # Contains a dictionary that maps remote projects IDs to their sessions.
         self._batch_ids = set()         # Contains a list that tracks all calls made to the client during a session.
         self._socket_buffer = None      # Contains instance of the socket buffer used to communicate with Artella App.
         self._running = False           # Flag that is True while Artella Drive thread is running.
@@ -338,8 +339,27 @@ class ArtellaDriveClient(object):
             remote_session_projects = remote_session.get('projects', dict())
             self._remote_projects[remote_session_api] = remote_session_projects
 
+        self._projects_sessions.clear()
+        for remote_session_api, remote_session_projects in self._remote_projects.items():
+            for project_id in remote_session_projects:
+                self._projects_sessions.setdefault(project_id, remote_session_api)
+
         return self._remote_projects
 
+    def get_project_remote_session(self, project_id):
+        """
+        Returns the remote session the project with given ID belongs to
+
+        :param str project_id: ID of the project in remote Artella server
+        :return: Remote session of the project or None if the project is not available in any remote session
+        :rtype: str or None
+        """
+
+        if not self.get_remote_projects():
+            return None
+
+        return self._projects_sessions.get(project_id, None)
+
     def get_project_name(self, project_id, remote_session=None):
         """
         Returns the project name giving its remote Artella ID
@@ -655,7 +675,7 @@ class ArtellaDriveClient(object):
             logger.warning('Was not possible to retrieve Project ID from path: {}!'.format(file_path))
             return None
 
-        if project_name not in list(local_projects.keys()):
+        if project_name not in local_projects:
             logger.warning(
                 'Was not possible to retrieve Project ID from path because project "{}" is not recognized!'.format(
                     project_name))
@@ -47,3 +47,9 @@ CRLF = "\r\n"
 
 # Configuration file for Artella Plugins
 ARTELLA_PLUGIN_CONFIG = 'artella-plugin.json'
+
+# Precompiled Artella Plugin configuration file. Stores plugin configuration with its module and entry class
+ARTELLA_PLUGIN_MANIFEST = '__artella_manifest__.pkl'
+
+# Cache file used to store already parsed Artella Plugins configuration files
+ARTELLA_PLUGINS_CACHE = '.artella-plugins.cache'
@@ -102,7 +102,7 @@ def current_dcc():
                 CURRENT_DCC_MODULE = dcc_module_name
                 logger.info('Current DCC: {}'.format(CURRENT_DCC))
                 return CURRENT_DCC
-            except ImportError as exc:
+            except ImportError:
                 continue
 
 
@@ -40,6 +40,7 @@ else:
         closed = QtCore.Signal()
 
         def __init__(self, parent=None, **kwargs):
+            qtutils.ensure_application()
             if not parent:
                 from artella import dcc
                 parent = dcc.get_main_window()
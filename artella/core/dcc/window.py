@@ -42,6 +42,7 @@ if not qtutils.QT_AVAILABLE:
 else:
     class BaseWindow(QtWidgets.QMainWindow):
         def __init__(self, parent=None, **kwargs):
+            qtutils.ensure_application()
             if not parent:
                 from artella import dcc
                 parent = dcc.get_main_window()
@@ -882,7 +882,6 @@ class BaseArtellaDccPlugin(object):
         valid_download = True
         while True:
             if show_dialogs:
-                dcc_progress_bar.repaint()
                 if dcc_progress_bar.is_cancelled():
                     artella_drive_client.pause_downloads()
                     valid_download = False
@@ -25,13 +25,25 @@ class _MetaDownloader(type):
 class AbstractDownloader(object):
 
     @utils.abstract
-    def download(self, file_paths, show_dialogs=True):
+    def download(self, file_paths, show_dialogs=True, progress_callback=None, is_cancelled=None):
+        """
+        Downloads given files.
+        When files are downloaded through the download splash dialog, this function is executed in a worker thread,
+        so implementations must not call DCC APIs that are not thread safe (such as Maya cmds) directly.
+        :param list(str) file_paths: paths of the files to download
+        :param bool show_dialogs: Whether UI dialogs should appear or not.
+        :param callable progress_callback: if given, function called with the file path, its download status and its
+            download progress every time the download progress of a file changes
+        :param callable is_cancelled: if given, function that returns whether or not downloads were cancelled.
+            Implementations should poll it while downloading and stop downloading once it returns True.
+        """
+
         pass
 
 
 class BaseDownloader(AbstractDownloader):
 
-    def download(self, file_paths, show_dialogs=True):
+    def download(self, file_paths, show_dialogs=True, progress_callback=None, is_cancelled=None):
         pass
 
 
@@ -7,14 +7,55 @@ Module that contains Artella Plugins framework implementation
 
 from __future__ import print_function, division, absolute_import
 
+import sys
+import weakref
 import logging
-import inspect
 
 from artella import dcc
 from artella.core import dccplugin
 
 logger = logging.getLogger('artella')
 
+# Name of the current DCC, cached the first time plugins or plugins manager request it
+_DCC_NAME = None
+
+# Cache of DCC menus that are known to exist. Shared by all plugins, so menus shared between plugins (such as
+# "More Artella") are only checked once
+_EXISTING_MENUS = set()
+
+
+def get_dcc_name():
+    """
+    Returns the name of the current DCC. DCC will not change during a session, so its name is cached.
+    :return: Name of the current DCC
+    :rtype: str
+    """
+
+    global _DCC_NAME
+    if _DCC_NAME is None:
+        _DCC_NAME = dcc.name()
+
+    return _DCC_NAME
+
+
+def _menu_exists(menu_name):
+    """
+    Internal function that returns whether or not the DCC menu with given name exists.
+    Only existing menus are cached, so menus created later are found.
+    :param str menu_name: name of the menu to search for
+    :return: True if the menu already exists; False otherwise
+    :rtype: bool
+    """
+
+    if menu_name in _EXISTING_MENUS:
+        return True
+
+    menu_exists = dcc.check_menu_exists(menu_name)
+    if menu_exists:
+        _EXISTING_MENUS.add(menu_name)
+
+    return menu_exists
+
 
 class ArtellaPlugin(object):
 
@@ -49,7 +90,9 @@ class ArtellaPlugin(object):
         if self._loaded:
             dcc.execute_deferred(self.cleanup)
 
-        dcc.execute_deferred(self.init_ui)
+        # Plugins UI is not available when DCC is executed in batch mode
+        if not dcc.is_batch():
+            dcc.execute_deferred(self.init_ui)
 
         self._loaded = True
 
@@ -63,20 +106,19 @@ class ArtellaPlugin(object):
             return
 
         plugin_menu = self._config_dict.get('menu')
-        plugin_package = self._config_dict.get('package', 'Artella')
         plugin_dccs = self._config_dict.get('dcc', list())
 
         can_load_plugin = True
         if plugin_dccs:
-            can_load_plugin = dcc.name() in plugin_dccs
+            can_load_plugin = get_dcc_name() in plugin_dccs
 
         if can_load_plugin:
             if plugin_menu and 'label' in plugin_menu:
                 menu_parents = plugin_menu.get('parents', None)
                 if menu_parents:
-                    current_parent = 'Artella' if dcc.check_menu_exists('Artella') else None
+                    current_parent = 'Artella' if _menu_exists('Artella') else None
                     for menu_parent in menu_parents:
-                        if not dcc.check_menu_exists(menu_parent):
+                        if not _menu_exists(menu_parent):
 
                             # TODO: Before More Artella menu addition we force the creation of a
                             # TODO: separator. We should find a way to avoid hardcoded this.
@@ -85,7 +127,8 @@ class ArtellaPlugin(object):
                                 dcc.add_menu_separator('Artella')
                                 icon = 'artella.png'
 
-                            dcc.add_sub_menu_item(menu_parent, parent_menu=current_parent, icon=icon)
+                            if dcc.add_sub_menu_item(menu_parent, parent_menu=current_parent, icon=icon):
+                                _EXISTING_MENUS.add(menu_parent)
                         current_parent = menu_parent
 
                 menu_label = plugin_menu['label']
@@ -109,6 +152,9 @@ class ArtellaPlugin(object):
             menu_label = plugin_menu['label']
             dcc.remove_menu_item(menu_label, menu)
 
+        # Menus can be removed once plugins are disabled, so we make sure they are checked again
+        _EXISTING_MENUS.clear()
+
         self._loaded = False
 
     @property
@@ -134,15 +180,140 @@ class ArtellaPlugin(object):
         return self._stats
 
 
+class LazyArtellaPlugin(ArtellaPlugin):
+    """
+    Artella Plugin proxy used by plugins that declare their module and entry class in their configuration file.
+    Plugin menus are created from the plugin configuration and the plugin module is not imported until plugin UI
+    is initialized or until one of the plugin attributes is accessed for the first time. In batch mode, plugin UI is
+    not initialized, so plugin module is only imported when the plugin is used.
+    """
+
+    def __init__(self, plugin_id, config_dict=None, manager=None):
+
+        self.ID = plugin_id
+        self._plugin = None
+
+        super(LazyArtellaPlugin, self).__init__(config_dict=config_dict, manager=manager)
+
+        # Stats are initialized from the entry class declared in the plugin configuration, so they do not refer to
+        # the proxy class
+        self._stats = ArtellaPluginStats(
+            self, module_name=self._config_dict.get('module', None),
+            class_name=self._config_dict.get('entry_class', None))
+
+    def __getattr__(self, name):
+
+        # This function is only called when the attribute is not found in the proxy
+        if name.startswith('__') or name in ('ID', '_plugin'):
+            raise AttributeError(name)
+
+        plugin_inst = self.load()
+        if plugin_inst is None:
+            raise AttributeError(
+                'Artella Plugin "{}" cannot be loaded. Attribute "{}" is not available'.format(self.ID, name))
+
+        return getattr(plugin_inst, name)
+
+    @property
+    def manager(self):
+        """
+        Returns Artella Plugins manager instance that is owner of this plugin
+
+        :return: Artella Plugin manager instance that owns this plugin
+        :rtype: ArtellaPluginsManager
+        """
+
+        return self._plugin.manager if self._plugin is not None else self._manager
+
+    @property
+    def stats(self):
+        """
+        Returns Artella Plugin Stats instance that stores useful data related with the plugin.
+        Once the proxied plugin is loaded, its stats are returned.
+
+        :return: Artella Plugin Stats instance with useful data of the plugin
+        :rtype: ArtellaPluginStats
+        """
+
+        return self._plugin.stats if self._plugin is not None else self._stats
+
+    def is_loaded(self):
+        """
+        Returns whether or not this plugin is loaded. Once the proxied plugin is loaded, its state is returned.
+        :return: True if the plugin is loaded; False otherwise.
+        :rtype: bool
+        """
+
+        return self._plugin.is_loaded() if self._plugin is not None else self._loaded
+
+    def init_ui(self):
+        """
+        Function that initializes plugin UI related functionality
+        Menus are created from plugin configuration. Proxied plugin is loaded afterwards, so plugins that override
+        their UI initialization are initialized as usual.
+        """
+
+        super(LazyArtellaPlugin, self).init_ui()
+
+        self.load()
+
+    def load(self):
+        """
+        Imports plugin module and instantiates the proxied plugin, if it is not already loaded
+        :return: Proxied plugin instance or None if the plugin cannot be loaded
+        :rtype: ArtellaPlugin or None
+        """
+
+        if self._plugin is not None:
+            return self._plugin
+
+        from artella.core import plugins
+
+        plugin_class = plugins.load_plugin_class(self.ID)
+        if not plugin_class:
+            return None
+
+        # Menus are managed by the proxy, so we make sure that proxied plugin does not create them again.
+        # Proxied plugin is initialized by its constructor, so its own init and init_ui functions are called.
+        config_dict = dict(self._config_dict)
+        config_dict.pop('menu', None)
+        self._plugin = plugin_class(config_dict, manager=self._manager)
+
+        return self._plugin
+
+    def cleanup(self):
+        """
+        Function that is called when the plugin is disabled
+        """
+
+        super(LazyArtellaPlugin, self).cleanup()
+
+        if self._plugin is not None:
+            self._plugin.cleanup()
+
+
 class ArtellaPluginStats(object):
-    def __init__(self, plugin):
-        self._plugin = plugin
-        self._id = self._plugin.ID
+    def __init__(self, plugin, module_name=None, class_name=None):
+
+        # We store a weak reference to the plugin to avoid keeping plugins alive once they are unloaded
+        self._plugin_ref = weakref.ref(plugin)
+        self._id = plugin.ID
         self._start_time = 0.0
         self._end_time = 0.0
         self._execution_time = 0.0
         self._info = dict()
-        self._init()
+        self._init(plugin, module_name=module_name, class_name=class_name)
+
+    @property
+    def plugin(self):
+        """
+        Returns the plugin these stats belong to
+
+        :return: Artella Plugin instance or None if the plugin does not exist anymore
+        :rtype: ArtellaPlugin or None
+        """
+
+        return self._plugin_ref()
 
     @property
     def start_time(self):
@@ -197,17 +368,25 @@ class ArtellaPluginStats(object):
 
         return self._execution_time
 
-    def _init(self):
+    def _init(self, plugin, module_name=None, class_name=None):
         """
         Internal function that initializes info for the plugin and its environment
+
+        :param ArtellaPlugin plugin: plugin to initialize info of
+        :param str module_name: name of the plugin module. If not given, plugin class module is used.
+        :param str class_name: name of the plugin class. If not given, plugin class name is used.
         """
 
-        from artella import dcc
+        # We retrieve plugin file path from its module to avoid the expensive lookup done by inspect.getfile.
+        # Modules of lazy plugins are not imported yet, so their file path is not available.
+        plugin_class = plugin.__class__
+        module_name = module_name or plugin_class.__module__
+        plugin_module = sys.modules.get(module_name, None)
 
         self._info.update({
-            'name': self._plugin.__class__.__name__,
-            'module': self._plugin.__class__.__module__,
-            'filepath': inspect.getfile(self._plugin.__class__),
+            'name': class_name or plugin_class.__name__,
+            'module': module_name,
+            'filepath': getattr(plugin_module, '__file__', '') if plugin_module else '',
             'id': self._id,
-            'application': dcc.name()
+            'application': get_dcc_name()
         })
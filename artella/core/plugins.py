@@ -9,24 +9,81 @@ from __future__ import print_function, division, absolute_import
 
 import os
 import sys
+import pickle
 import inspect
 import logging
 import traceback
+try:
+    from os import scandir
+except ImportError:
+    scandir = None
 
 from artella import dcc
-from artella.core import consts, utils, plugin
+from artella.core import consts, utils, plugin, resource
 
 logger = logging.getLogger('artella')
 
 _PLUGINS = dict()
+_PLUGINS_BY_NAME = dict()
 _PLUGIN_PATHS = list()
 
 
+class PluginRecord(object):
+    """
+    Class that stores the data of a registered Artella plugin
+    For backwards compatibility, data can also be accessed using the keys of the old registered plugins dictionaries.
+    """
+
+    __slots__ = (
+        'name', 'package', 'icon', 'cls', 'config', 'version', 'resource_paths', 'module', 'class_name', 'instance')
+
+    # Maps old registered plugins dictionaries keys to record attributes
+    _KEYS = {'class': 'cls', 'plugin_instance': 'instance'}
+
+    def __init__(
+            self, name=None, package=None, icon=None, cls=None, config=None, version=None, resource_paths=None,
+            module=None, class_name=None, instance=None):
+        self.name = name
+        self.package = package
+        self.icon = icon
+        self.cls = cls
+        self.config = config
+        self.version = version
+        self.resource_paths = resource_paths
+        self.module = module
+        self.class_name = class_name
+        self.instance = instance
+
+    def __getitem__(self, key):
+        attr_name = self._KEYS.get(key, key)
+        if attr_name not in self.__slots__:
+            raise KeyError(key)
+
+        return getattr(self, attr_name)
+
+    def get(self, key, default=None):
+        """
+        Returns the value of the given key or the default value if the key is not available
+
+        :param str key: key of the value to retrieve
+        :param object default: value returned if the key is not available or if its value is None
+        :return: Value of the given key
+        :rtype: object
+        """
+
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+
+        return default if value is None else value
+
+
 def plugins():
     """
     Returns a dictionary containing all the info of already registered Artella plugins
     :return: Dictionary with already loaded Artella plugins information
-    :rtype :dict
+    :rtype :dict(str, PluginRecord)
     """
 
     return _PLUGINS
@@ -50,15 +107,11 @@ def get_plugin_by_name(plugin_name):
     :rtype: ArtellaPlugin
     """
 
-    if not _PLUGINS:
+    plugin_id = _PLUGINS_BY_NAME.get(plugin_name, None)
+    if not plugin_id:
         return None
 
-    for plugin_id, plugin_dict in _PLUGINS.items():
-        plug_name = plugin_dict['name']
-        if plugin_name == plug_name:
-            return plugin_dict['plugin_instance']
-
-    return None
+    return get_plugin_by_id(plugin_id)
 
 
 def get_plugin_by_id(plugin_id):
@@ -69,12 +122,9 @@ def get_plugin_by_id(plugin_id):
     :rtype: ArtellaPlugin
     """
 
-    if not _PLUGINS:
-        return None
+    plugin_record = _PLUGINS.get(plugin_id, None)
 
-    for plug_id, plugin_dict in _PLUGINS.items():
-        if plug_id == plugin_id:
-            return plugin_dict['plugin_instance']
+    return plugin_record.instance if plugin_record else None
 
 
 def register_paths(plugin_paths):
@@ -105,123 +155,97 @@ def load_registered_plugins(dev=False):
         logger.info('No Artella Plugins found to load!')
         return
 
+    # Plugins manifests are cached in disk, so we only need to walk plugin paths that changed since last load.
+    # Cache file is shared by all DCCs, so entries of plugin paths not registered in this session are kept.
+    manifest_cache = dict() if dev else _load_manifest_cache()
+    cache_updated = False
     found_paths = dict()
 
     for plugin_path in plugin_paths:
-        for root, dirs, files in os.walk(plugin_path):
-            if consts.ARTELLA_PLUGIN_CONFIG not in files:
-                continue
-            clean_path = utils.clean_path(root)
-            found_paths[clean_path] = os.path.join(root, consts.ARTELLA_PLUGIN_CONFIG)
+        plugin_manifests, path_updated = _get_cached_manifests(plugin_path, manifest_cache)
+        cache_updated = cache_updated or path_updated
+        for plugin_root, (config_path, config_mtime, plugin_config) in plugin_manifests.items():
+            found_paths[plugin_root] = (config_path, plugin_config)
+
+    if not dev and cache_updated:
+        _save_manifest_cache(manifest_cache)
 
     if not found_paths:
         logger.info('No plugins found in registered plugin paths: {}'.format(_PLUGIN_PATHS))
         return
 
+    sys_paths = set(sys.path)
+    new_sys_paths = list()
     for plugin_path in plugin_paths:
         for plugin_dir in os.listdir(plugin_path):
             clean_path = utils.clean_path(os.path.join(plugin_path, plugin_dir))
-            if os.path.isdir(clean_path) and clean_path not in sys.path:
-                sys.path.append(clean_path)
+            if clean_path not in sys_paths and os.path.isdir(clean_path):
+                new_sys_paths.append(clean_path)
+                sys_paths.add(clean_path)
+    sys.path.extend(new_sys_paths)
 
-    for plugin_path, plugin_config in found_paths.items():
+    dcc_name = plugin.get_dcc_name()
 
-        # Search sub modules paths
-        sub_modules_found = list()
-        for sub_module in utils.iterate_modules(plugin_path):
-            file_name = os.path.splitext(os.path.basename(sub_module))[0]
-            if file_name.startswith('_') or file_name.startswith('test_') or sub_module.endswith('.pyc'):
-                continue
-            if not sub_module or sub_module in sub_modules_found:
-                continue
-            sub_modules_found.append(sub_module)
-        if not sub_modules_found:
+    for plugin_path, (config_path, plugin_config) in found_paths.items():
+
+        # Plugins that declare their module and entry class in their configuration file are registered without
+        # importing their module. The module will be imported the first time the plugin is used.
+        if plugin_config.get('module') and plugin_config.get('entry_class'):
+            register_lazy_plugin(
+                config_path, plugin_path, 'DEV' if dev else plugin_config.get('version', None),
+                plugin_config=plugin_config)
             continue
 
-        # Find specific DCC plugin implementation
-        dcc_name = dcc.name()
-        sub_module = sub_modules_found[0]
-
-        max_length = 50
-        index = 0
-        artella_module_parts = list()
-        temp_sub_module = sub_module
-        while True:
-            if index > max_length:
-                artella_module_parts = list()
-                break
-            base_name = os.path.basename(temp_sub_module)
-            if not base_name or base_name == 'artella':
-                artella_module_parts.append(base_name)
-                break
-            artella_module_parts.append(base_name)
-            temp_sub_module = os.path.dirname(temp_sub_module)
-            index += 1
-        if not artella_module_parts:
-            module_path = utils.convert_module_path_to_dotted_path(os.path.normpath(sub_module))
-        else:
-            module_path = os.path.splitext('.'.join(reversed(artella_module_parts)))[0]
+        sub_module, module_path = _get_plugin_module_path(plugin_path)
+        if not module_path:
+            continue
 
-        module_path_split = module_path.split('.')
-        dcc_module_path = '{}.{}.{}'.format('.'.join(module_path_split[:-1]), dcc_name, module_path_split[-1])
-        sub_module_obj = utils.import_module(dcc_module_path, skip_exceptions=True)
+        sub_module_obj = _import_plugin_module(module_path, dcc_name)
         if not sub_module_obj:
-            sub_module_obj = utils.import_module(module_path)
-            if not sub_module_obj:
-                logger.error('Error while importing Artella Plugin module: {}'.format(module_path))
-                continue
+            continue
 
-        if dev:
-            plugin_version = 'DEV'
-        else:
-            plugin_version = None
-            module_path_dir = module_path.rsplit('.', 1)[0]
-            version_module_path = '{}.__version__'.format(module_path_dir)
-            version_module_path = version_module_path.replace('.{}.__'.format(dcc_name), '.__')
-            try:
-                version_module_obj = utils.import_module(version_module_path)
-            except Exception:
-                version_module_obj = None
-            if version_module_obj:
-                try:
-                    plugin_version = version_module_obj.get_version()
-                except Exception as exc:
-                    logger.warning(
-                        'Impossible to retrieve version for Artella Plugin module: {} | {}'.format(module_path, exc))
+        plugin_version = 'DEV' if dev else _get_plugin_version(module_path, dcc_name)
+
+        # Plugin modules can declare their plugin class explicitly through the __artella_plugin__ attribute. In that
+        # scenario, we can skip the inspection of all the module members
+        declared_plugin = getattr(sub_module_obj, '__artella_plugin__', None)
+        if declared_plugin is not None:
+            register_plugin(
+                declared_plugin, config_path, os.path.dirname(sub_module), plugin_version, plugin_config=plugin_config)
+            continue
 
-        for member in utils.iterate_module_members(sub_module_obj, predicate=inspect.isclass):
-            register_plugin(member[1], plugin_config, os.path.dirname(sub_module), plugin_version)
+        # Only classes defined in the plugin module are taken into account
+        sub_module_name = sub_module_obj.__name__
+        for member in utils.iterate_module_members(
+                sub_module_obj,
+                predicate=lambda obj: inspect.isclass(obj) and getattr(obj, '__module__', None) == sub_module_name):
+            register_plugin(
+                member[1], config_path, os.path.dirname(sub_module), plugin_version, plugin_config=plugin_config)
 
     if not _PLUGINS:
         logger.warning('No Artella plugins found to load!')
         return
 
-    ordered_plugins_list = list()
-    for plugin_id, plugin_dict in _PLUGINS.items():
-        plugin_class = plugin_dict['class']
-        plugin_index = plugin_class.INDEX or -1
-        index = 0
-        for i, plugin_item in enumerate(ordered_plugins_list):
-            plugin_item_index = list(plugin_item.values())[0]['index']
-            if plugin_index < plugin_item_index:
-                index += 1
-        ordered_plugins_list.insert(index, {plugin_id: {'index': plugin_index, 'dict': plugin_dict}})
-
-    for plugin_item in ordered_plugins_list:
-        plugin_id = list(plugin_item.keys())[0]
-        plugin_dict = list(plugin_item.values())[0]['dict']
-        plugin_class = plugin_dict['class']
-        plugin_config_dict = plugin_dict.get('config', dict())
+    # Plugins with higher index are instantiated first
+    ordered_plugins = sorted(_PLUGINS.items(), key=lambda item: _get_plugin_index(item[1]), reverse=True)
+
+    for plugin_id, plugin_record in ordered_plugins:
+        plugin_class = plugin_record.cls
+        plugin_config_dict = plugin_record.config or dict()
         try:
-            plugin_inst = plugin_class(plugin_config_dict)
+            if plugin_class is None:
+                plugin_inst = plugin.LazyArtellaPlugin(plugin_id, plugin_config_dict)
+            else:
+                plugin_inst = plugin_class(plugin_config_dict)
         except Exception:
             logger.error('Impossible to instantiate Artella Plugin: "{}"'.format(plugin_id))
             logger.error(traceback.format_exc())
             continue
-        _PLUGINS[plugin_id]['plugin_instance'] = plugin_inst
+        plugin_record.instance = plugin_inst
 
 
-def register_plugin(class_obj, config_path, plugin_path, plugin_version=None, plugin_interface=None):
+def register_plugin(
+        class_obj, config_path, plugin_path, plugin_version=None, plugin_interface=None, plugin_config=None):
     """
     Registers an Artella plugin instance into the manager
     :param class_obj:
@@ -229,11 +253,13 @@ def register_plugin(class_obj, config_path, plugin_path, plugin_version=None, pl
     :param plugin_path:
     :param plugin_version:
     :param plugin_interface:
+    :param dict plugin_config: already parsed plugin configuration. If not given, config file will be read.
     :return:
     :rtype: bool
     """
 
-    if not config_path or not os.path.isfile(config_path):
+    # If the plugin configuration is already parsed, we do not need to check its file for each registered class
+    if plugin_config is None and (not config_path or not os.path.isfile(config_path)):
         logger.warning(
             'Impossible to register Artella Plugin: {} because its config file does not exists: {}!'.format(
                 class_obj, config_path))
@@ -253,49 +279,143 @@ def register_plugin(class_obj, config_path, plugin_path, plugin_version=None, pl
         logger.warning('Artella Plugin: "{}" already registered!'.format(plugin_id))
         return True
 
-    try:
-        plugin_config = utils.read_json(config_path)
-    except Exception:
+    if plugin_config is None:
+        try:
+            plugin_config = utils.read_json(config_path)
+        except Exception:
+            logger.warning(
+                'Artella Plugin "{}" configuration file "{}" has not a proper structure. Skipping plugin ...'.format(
+                    plugin_id, config_path))
+            return False
+
+    return _add_plugin(plugin_id, class_obj, plugin_config, plugin_path, plugin_version)
+
+
+def register_lazy_plugin(config_path, plugin_path, plugin_version=None, plugin_config=None):
+    """
+    Registers an Artella plugin into the manager without importing its module. Plugin configuration file must define
+    both the "module" and the "entry_class" keys. Plugin module is imported the first time the plugin is used.
+    :param str config_path: path to the plugin configuration file
+    :param str plugin_path: root path of the plugin
+    :param str plugin_version: version of the plugin
+    :param dict plugin_config: already parsed plugin configuration. If not given, config file will be read.
+    :return: True if the plugin was registered successfully; False otherwise.
+    :rtype: bool
+    """
+
+    if plugin_config is None and (not config_path or not os.path.isfile(config_path)):
         logger.warning(
-            'Artella Plugin "{}" configuration file "{}" has not a proper structure. Skipping plugin ...'.format(
-                plugin_id, config_path))
+            'Impossible to register Artella Plugin because its config file does not exists: {}!'.format(config_path))
         return False
 
-    plugin_name = plugin_config.get('name', None)
-    plugin_package = plugin_config.get('package', None)
-    plugin_icon = plugin_config.get('icon', None)
-    plugin_resources = plugin_config.get('resources', None)
+    if plugin_config is None:
+        try:
+            plugin_config = utils.read_json(config_path)
+        except Exception:
+            logger.warning(
+                'Artella Plugin configuration file "{}" has not a proper structure. Skipping plugin ...'.format(
+                    config_path))
+            return False
+
+    plugin_module = plugin_config.get('module', None)
+    plugin_class_name = plugin_config.get('entry_class', None)
+    if not plugin_module or not plugin_class_name:
+        logger.warning(
+            'Impossible to register Artella Plugin because its config file "{}" does not define '
+            'its module and entry class!'.format(config_path))
+        return False
 
-    # Register DCC resources, both DCC specific plugin implementation
-    # resources and generic implementation resources
-    plugin_resources_paths = list()
-    if plugin_resources and plugin_path:
-        plugin_path_base = os.path.basename(plugin_path)
-        if plugin_path_base == dcc.name():
-            plugin_resources_paths.append(os.path.join(plugin_path, plugin_resources))
-            plugin_resources_paths.append(os.path.join(os.path.dirname(plugin_path), plugin_resources))
-        else:
-            plugin_resources_paths.append(os.path.join(plugin_path, plugin_resources))
-        for plugin_resources_path in plugin_resources_paths:
-            if os.path.isdir(plugin_resources_path):
-                dcc.register_dcc_resource_path(plugin_resources_path)
-                icons_path = os.path.join(plugin_resources_path, 'icons')
-                if os.path.isdir(icons_path):
-                    dcc.register_dcc_resource_path(icons_path)
-
-    _PLUGINS[plugin_id] = {
-        'name': plugin_name,
-        'package': plugin_package,
-        'icon': plugin_icon,
-        'class': class_obj,
-        'config': plugin_config,
-        'version': plugin_version,
-        'resource_paths': plugin_resources_paths
-    }
+    plugin_id = plugin_config.get('id', None) or plugin_class_name
+    if plugin_id in _PLUGINS:
+        logger.warning('Artella Plugin: "{}" already registered!'.format(plugin_id))
+        return True
 
-    logger.info('Artella Plugin: "{}" registered successfully!'.format(plugin_id))
+    return _add_plugin(
+        plugin_id, None, plugin_config, plugin_path, plugin_version,
+        module=plugin_module, class_name=plugin_class_name)
 
-    return True
+
+def load_plugin_class(plugin_id):
+    """
+    Returns the plugin class of the plugin with given ID. If the plugin was registered lazily, its module is imported.
+    :param str plugin_id: ID of the plugin we want to retrieve class of
+    :return: Plugin class or None if the plugin class cannot be loaded
+    :rtype: type or None
+    """
+
+    plugin_record = _PLUGINS.get(plugin_id, None)
+    if not plugin_record:
+        return None
+    if plugin_record.cls is not None:
+        return plugin_record.cls
+
+    dcc_name = plugin.get_dcc_name()
+    module_path = plugin_record.module
+    module_obj = _import_plugin_module(module_path, dcc_name)
+    if not module_obj:
+        return None
+
+    class_obj = getattr(module_obj, plugin_record.class_name, None)
+    if not inspect.isclass(class_obj) or not issubclass(class_obj, plugin.ArtellaPlugin):
+        logger.error('Artella Plugin class "{}" not found in module: {}'.format(plugin_record.class_name, module_path))
+        return None
+
+    plugin_record.cls = class_obj
+    if plugin_record.version is None:
+        plugin_record.version = _get_plugin_version(module_path, dcc_name)
+
+    return class_obj
+
+
+def build_plugin_manifest(plugin_path):
+    """
+    Builds the precompiled manifest of the Artella plugin located in the given path. The manifest stores the plugin
+    configuration together with the plugin module, entry class, ID, index and version, so the plugin can be
+    registered without parsing its configuration file or importing its module. This function is intended to be
+    called when plugin packages are built.
+    :param str plugin_path: root path of the plugin (folder where plugin configuration file is located)
+    :return: Path of the generated manifest or None if the manifest cannot be generated
+    :rtype: str or None
+    """
+
+    config_path = os.path.join(plugin_path, consts.ARTELLA_PLUGIN_CONFIG)
+    if not os.path.isfile(config_path):
+        logger.warning('Impossible to build Artella Plugin manifest because config file does not exists: {}'.format(
+            config_path))
+        return None
+
+    plugin_config = utils.read_json(config_path) or dict()
+    _, module_path = _get_plugin_module_path(utils.clean_path(plugin_path))
+    module_obj = utils.import_module(module_path) if module_path else None
+    if not module_obj:
+        logger.warning('Impossible to build Artella Plugin manifest because its module cannot be imported: {}'.format(
+            plugin_path))
+        return None
+
+    plugin_class = getattr(module_obj, '__artella_plugin__', None)
+    if plugin_class is None:
+        for _, member in utils.iterate_module_members(module_obj, predicate=inspect.isclass):
+            if member.__module__ == module_obj.__name__ and issubclass(member, plugin.ArtellaPlugin):
+                plugin_class = member
+                break
+    if plugin_class is None:
+        logger.warning('No Artella Plugin class found in module: {}'.format(module_path))
+        return None
+
+    plugin_config.update({
+        'module': module_path,
+        'entry_class': plugin_class.__name__,
+        'id': plugin_class.ID or plugin_class.__name__,
+        'index': plugin_class.INDEX,
+        'version': _get_plugin_version(module_path, plugin.get_dcc_name())
+    })
+
+    # We use protocol 2 so manifests can be loaded both in Python 2 and Python 3 DCCs
+    manifest_path = os.path.join(plugin_path, consts.ARTELLA_PLUGIN_MANIFEST)
+    with open(manifest_path, 'wb') as manifest_file:
+        pickle.dump(plugin_config, manifest_file, protocol=2)
+
+    return manifest_path
 
 
 def shutdown(dev=False):
@@ -306,11 +426,412 @@ def shutdown(dev=False):
     if not _PLUGINS:
         return
 
-    for plugin_id, plugin_dict in _PLUGINS.items():
-        plugin_inst = plugin_dict.get('plugin_instance', None)
-        if not plugin_inst:
-            continue
-        if dev:
-            plugin_inst.cleanup()
+    plugin_instances = [
+        plugin_record.instance for plugin_record in _PLUGINS.values() if plugin_record.instance]
+    if not plugin_instances:
+        return
+
+    def _cleanup_plugins():
+        for plugin_inst in plugin_instances:
+            try:
+                plugin_inst.cleanup()
+            except Exception:
+                logger.error('Error while cleaning up Artella Plugin: "{}"'.format(plugin_inst.ID))
+                logger.error(traceback.format_exc())
+
+    # All plugins are cleaned up in a single deferred call
+    if dev:
+        _cleanup_plugins()
+    else:
+        dcc.execute_deferred(_cleanup_plugins)
+
+
+def _add_plugin(plugin_id, class_obj, plugin_config, plugin_path, plugin_version=None, **kwargs):
+    """
+    Internal function that adds a plugin into the registered plugins and registers its resources
+    :param str plugin_id: ID of the plugin
+    :param type or None class_obj: plugin class. None if the plugin is registered lazily.
+    :param dict plugin_config: parsed plugin configuration
+    :param str plugin_path: path of the plugin implementation
+    :param str plugin_version: version of the plugin
+    :param dict kwargs: extra data to store with the registered plugin (module and class name of lazy plugins)
+    :return: True if the plugin was registered successfully; False otherwise.
+    :rtype: bool
+    """
+
+    plugin_name = plugin_config.get('name', None)
+    plugin_resources_paths = _register_plugin_resources(plugin_config.get('resources', None), plugin_path)
+
+    _PLUGINS[plugin_id] = PluginRecord(
+        name=plugin_name,
+        package=plugin_config.get('package', None),
+        icon=plugin_config.get('icon', None),
+        cls=class_obj,
+        config=plugin_config,
+        version=plugin_version,
+        resource_paths=plugin_resources_paths,
+        **kwargs)
+    if plugin_name:
+        _PLUGINS_BY_NAME.setdefault(plugin_name, plugin_id)
+
+    logger.info('Artella Plugin: "{}" registered successfully!'.format(plugin_id))
+
+    return True
+
+
+def _get_plugin_index(plugin_record):
+    """
+    Internal function that returns the index of the given registered plugin. This index controls the instantiation
+    order of the plugins.
+    :param PluginRecord plugin_record: registered plugin data
+    :return: Plugin index
+    :rtype: int
+    """
+
+    plugin_class = plugin_record.cls
+    if plugin_class is None:
+        return plugin_record.config.get('index', None) or -1
+
+    return plugin_class.INDEX or -1
+
+
+def _get_plugin_module_path(plugin_path):
+    """
+    Internal function that returns the main module of the plugin located in the given path
+    :param str plugin_path: root path of the plugin
+    :return: Tuple containing the absolute path of the plugin module and its dotted module path
+    :rtype: tuple(str, str) or tuple(None, None)
+    """
+
+    # Only the first valid plugin module is used, so we stop searching as soon as it is found. Plugin modules are
+    # located inside packages, so folders that are not packages (such as resources ones) are not walked.
+    sub_module = next(
+        utils.iterate_modules(plugin_path, extensions=('.py',), skip_private=True, packages_only=True), None)
+    if not sub_module:
+        return None, None
+
+    sub_module_parts = os.path.normpath(sub_module).split(os.sep)
+    if 'artella' in sub_module_parts:
+        artella_index = len(sub_module_parts) - 1 - sub_module_parts[::-1].index('artella')
+        module_path = '.'.join(sub_module_parts[artella_index:]).rsplit('.', 1)[0]
+    else:
+        module_path = utils.convert_module_path_to_dotted_path(os.path.normpath(sub_module))
+
+    return sub_module, module_path
+
+
+def _import_plugin_module(module_path, dcc_name):
+    """
+    Internal function that imports given plugin module. DCC specific plugin implementation is imported if available.
+    :param str module_path: dotted path of the plugin module
+    :param str dcc_name: name of the current DCC
+    :return: Imported module object or None if the module cannot be imported
+    """
+
+    module_obj = None
+    dcc_module_path = None
+    if dcc_name:
+        module_path_split = module_path.split('.')
+        dcc_module_path = '{}.{}.{}'.format('.'.join(module_path_split[:-1]), dcc_name, module_path_split[-1])
+        module_obj = utils.import_module(dcc_module_path, skip_exceptions=True)
+    if not module_obj:
+        module_obj = utils.import_module(module_path)
+        if not module_obj:
+            logger.error('Error while importing Artella Plugin module: {} (DCC implementation: {})'.format(
+                module_path, dcc_module_path))
+            return None
+
+    return module_obj
+
+
+def _get_plugin_version(module_path, dcc_name):
+    """
+    Internal function that returns the version of the plugin the given module belongs to
+    :param str module_path: dotted path of the plugin module
+    :param str dcc_name: name of the current DCC
+    :return: Plugin version or None if the version cannot be retrieved
+    :rtype: str or None
+    """
+
+    module_path_dir = module_path.rsplit('.', 1)[0]
+    version_module_path = '{}.__version__'.format(module_path_dir)
+    version_module_path = version_module_path.replace('.{}.__'.format(dcc_name), '.__')
+    try:
+        version_module_obj = utils.import_module(version_module_path)
+    except Exception:
+        version_module_obj = None
+    if not version_module_obj:
+        return None
+
+    try:
+        return version_module_obj.get_version()
+    except Exception as exc:
+        logger.warning('Impossible to retrieve version for Artella Plugin module: {} | {}'.format(module_path, exc))
+
+    return None
+
+
+def _register_plugin_resources(plugin_resources, plugin_path):
+    """
+    Internal function that registers DCC resources, both DCC specific plugin implementation resources and generic
+    implementation resources
+    :param str plugin_resources: relative path of the plugin resources folder
+    :param str plugin_path: path of the plugin implementation
+    :return: List of plugin resources paths
+    :rtype: list(str)
+    """
+
+    plugin_resources_paths = list()
+    if not plugin_resources or not plugin_path:
+        return plugin_resources_paths
+
+    plugin_path_base = os.path.basename(plugin_path)
+    if plugin_path_base == plugin.get_dcc_name():
+        plugin_resources_paths.append(os.path.join(plugin_path, plugin_resources))
+        plugin_resources_paths.append(os.path.join(os.path.dirname(plugin_path), plugin_resources))
+    else:
+        plugin_resources_paths.append(os.path.join(plugin_path, plugin_resources))
+    for plugin_resources_path in plugin_resources_paths:
+        if os.path.isdir(plugin_resources_path):
+            resource.register_dcc_resources_path(plugin_resources_path)
+
+    return plugin_resources_paths
+
+
+def _find_manifests(plugin_path, max_depth=5, folder_mtimes=None):
+    """
+    Internal function that returns all the Artella Plugins configuration files located within the given path
+    :param str plugin_path: Path to search plugins configuration files in
+    :param int max_depth: maximum folder depth where plugins configuration files are searched
+    :param dict folder_mtimes: if given, modification times of the walked folders are stored in it
+    :return: Dictionary containing the clean plugin root as keys and a tuple with the configuration file path, its
+        modification time and its parsed contents as values
+    :rtype: dict
+    """
+
+    plugin_manifests = dict()
+
+    for root, config_path in _iterate_manifest_paths(plugin_path, max_depth=max_depth, folder_mtimes=folder_mtimes):
+        plugin_config = _read_precompiled_manifest(root, config_path)
+        if plugin_config is None:
+            try:
+                plugin_config = utils.read_json(config_path)
+            except Exception:
+                logger.warning(
+                    'Artella Plugin configuration file "{}" has not a proper structure. Skipping plugin ...'.format(
+                        config_path))
+                continue
+        plugin_manifests[utils.clean_path(root)] = (config_path, _get_config_mtime(config_path), plugin_config)
+
+    return plugin_manifests
+
+
+def _get_cached_manifests(plugin_path, manifest_cache):
+    """
+    Internal function that returns the Artella Plugins configuration files located within the given path, using the
+    given manifest cache when it is still valid. If not, plugin path is walked again and the cache is updated.
+    :param str plugin_path: Path to search plugins configuration files in
+    :param dict manifest_cache: manifest cache loaded from disk
+    :return: Tuple containing the plugin manifests (same as _find_manifests) and whether or not the cache was updated
+    :rtype: tuple(dict, bool)
+    """
+
+    cache_entry = manifest_cache.get(plugin_path, None)
+    if _is_manifest_cache_valid(cache_entry):
+        return cache_entry[1], False
+
+    folder_mtimes = dict()
+    plugin_manifests = _find_manifests(plugin_path, folder_mtimes=folder_mtimes)
+    manifest_cache[plugin_path] = (folder_mtimes, plugin_manifests)
+
+    return plugin_manifests, True
+
+
+def _get_config_mtime(config_path):
+    """
+    Internal function that returns the modification time of the given plugin configuration file. If a precompiled
+    manifest exists next to it, the most recent modification time of both files is returned.
+    :param str config_path: path of the plugin configuration file
+    :return: Modification time of the plugin configuration
+    :rtype: float
+    """
+
+    config_mtime = os.stat(config_path).st_mtime
+    manifest_path = os.path.join(os.path.dirname(config_path), consts.ARTELLA_PLUGIN_MANIFEST)
+    if os.path.isfile(manifest_path):
+        config_mtime = max(config_mtime, os.stat(manifest_path).st_mtime)
+
+    return config_mtime
+
+
+def _read_precompiled_manifest(root, config_path):
+    """
+    Internal function that reads the precompiled manifest of the plugin located in the given path
+    :param str root: root path of the plugin
+    :param str config_path: path of the plugin configuration file
+    :return: Plugin configuration stored in the manifest or None if the manifest does not exist, is older than the
+        plugin configuration file or cannot be read
+    :rtype: dict or None
+    """
+
+    manifest_path = os.path.join(root, consts.ARTELLA_PLUGIN_MANIFEST)
+    if not os.path.isfile(manifest_path) or os.stat(manifest_path).st_mtime < os.stat(config_path).st_mtime:
+        return None
+
+    try:
+        with open(manifest_path, 'rb') as manifest_file:
+            plugin_config = pickle.load(manifest_file)
+    except Exception as exc:
+        logger.warning('Impossible to read Artella Plugin manifest: "{}" | {}'.format(manifest_path, exc))
+        return None
+
+    return plugin_config if isinstance(plugin_config, dict) else None
+
+
+def _iterate_manifest_paths(root, depth=0, max_depth=5, folder_mtimes=None):
+    """
+    Internal function that iterates all the Artella Plugins configuration files located within the given path.
+    Plugins are self-contained, so folders containing a plugin configuration file are not traversed.
+    :param str root: Path to search plugins configuration files in
+    :param int depth: current folder depth
+    :param int max_depth: maximum folder depth where plugins configuration files are searched
+    :param dict folder_mtimes: if given, modification times of the walked folders are stored in it
+    :return: Iterator with tuples containing the plugin root path and its configuration file path
+    :rtype: iterator
+    """
+
+    config_path = os.path.join(root, consts.ARTELLA_PLUGIN_CONFIG)
+    if os.path.isfile(config_path):
+        yield root, config_path
+        return
+
+    # Adding or removing files or folders changes the modification time of their parent folder, so storing the
+    # modification time of every walked folder is enough to know if a plugin was added
+    if folder_mtimes is not None:
+        try:
+            folder_mtimes[root] = os.stat(root).st_mtime
+        except OSError:
+            return
+
+    if depth >= max_depth:
+        return
+
+    try:
+        if scandir is not None:
+            sub_folders = [entry.path for entry in scandir(root) if entry.is_dir(follow_symlinks=False)]
+        else:
+            sub_folders = [
+                sub_path for sub_path in (os.path.join(root, name) for name in os.listdir(root))
+                if os.path.isdir(sub_path) and not os.path.islink(sub_path)]
+    except OSError:
+        return
+
+    for sub_folder in sub_folders:
+        for manifest_path in _iterate_manifest_paths(
+                sub_folder, depth=depth + 1, max_depth=max_depth, folder_mtimes=folder_mtimes):
+            yield manifest_path
+
+
+def _is_manifest_cache_valid(cache_entry):
+    """
+    Internal function that returns whether or not given cached plugin manifests are still valid
+    :param tuple(dict, dict) or None cache_entry: modification times of the walked folders and cached plugin manifests
+    :return: True if none of the walked folders and cached configuration files changed since they were cached;
+        False otherwise.
+    :rtype: bool
+    """
+
+    if not isinstance(cache_entry, tuple) or len(cache_entry) != 2:
+        return False
+
+    folder_mtimes, plugin_manifests = cache_entry
+    for folder_path, folder_mtime in folder_mtimes.items():
+        try:
+            if os.stat(folder_path).st_mtime != folder_mtime:
+                return False
+        except OSError:
+            return False
+
+    for config_path, config_mtime, _ in plugin_manifests.values():
+        if not os.path.isfile(config_path) or _get_config_mtime(config_path) != config_mtime:
+            return False
+
+    return True
+
+
+def _get_manifest_cache_path():
+    """
+    Internal function that returns the path where Artella Plugins manifest cache is stored
+    :return: Absolute path of the manifest cache file
+    :rtype: str
+    """
+
+    return os.path.join(os.path.expanduser('~'), 'artella', consts.ARTELLA_PLUGINS_CACHE)
+
+
+def _load_manifest_cache():
+    """
+    Internal function that loads Artella Plugins manifest cache from disk
+    :return: Dictionary containing the modification times of the walked folders and the cached plugin manifests for
+        each plugin path
+    :rtype: dict
+    """
+
+    cache_path = _get_manifest_cache_path()
+    if not os.path.isfile(cache_path):
+        return dict()
+
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            manifest_cache = pickle.load(cache_file)
+    except Exception as exc:
+        logger.warning('Impossible to load Artella Plugins manifest cache: "{}" | {}'.format(cache_path, exc))
+        return dict()
+
+    if not isinstance(manifest_cache, dict):
+        return dict()
+
+    # Entries stored with a different cache format are discarded
+    return {
+        plugin_path: cache_entry for plugin_path, cache_entry in manifest_cache.items()
+        if isinstance(cache_entry, tuple) and len(cache_entry) == 2}
+
+
+def _save_manifest_cache(manifest_cache):
+    """
+    Internal function that stores given Artella Plugins manifest cache into disk.
+    Cache is written into a temporary file that replaces the cache file once it is complete, so DCCs loading plugins
+    at the same time never read a partially written cache.
+    :param dict manifest_cache: Dictionary containing the modification times of the walked folders and the cached
+        plugin manifests for each plugin path
+    :return: True if the manifest cache was stored successfully; False otherwise.
+    :rtype: bool
+    """
+
+    cache_path = _get_manifest_cache_path()
+    temp_path = '{}.{}.tmp'.format(cache_path, os.getpid())
+
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        # We use protocol 2 so the cache can be loaded both in Python 2 and Python 3 DCCs
+        with open(temp_path, 'wb') as cache_file:
+            pickle.dump(manifest_cache, cache_file, protocol=2)
+        if hasattr(os, 'replace'):
+            os.replace(temp_path, cache_path)
         else:
-            dcc.execute_deferred(plugin_inst.cleanup)
+            # In Python 2, os.rename does not overwrite existing files in Windows
+            if utils.is_windows() and os.path.isfile(cache_path):
+                os.remove(cache_path)
+            os.rename(temp_path, cache_path)
+    except Exception as exc:
+        logger.warning('Impossible to store Artella Plugins manifest cache: "{}" | {}'.format(cache_path, exc))
+        if os.path.isfile(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        return False
+
+    return True
@@ -53,16 +53,11 @@ class ArtellaProject(object):
         if not project_id:
             raise Exception('Project cannot be created because no ID was given')
 
-        projects = client.get_remote_projects()
-
-        new_project = None
-        for remote_session, project_ids in projects.items():
-            if project_id in project_ids:
-                project_name = client.get_project_name(project_id)
-                new_project = cls(session=remote_session, project_id=project_id, name=project_name, client=client)
-                break
-
-        if not new_project:
+        remote_session = client.get_project_remote_session(project_id)
+        if not remote_session:
             raise Exception('Impossible to create project with ID: "{}"'.format(project_id))
 
-        return new_project
+        # We already know the remote session of the project, so we avoid searching the project in all sessions
+        project_name = client.get_project_name(project_id, remote_session=remote_session)
+
+        return cls(session=remote_session, project_id=project_id, name=project_name, client=client)
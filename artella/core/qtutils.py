@@ -8,8 +8,9 @@ Module that contains ArtellaDrive Qt related utils classes and functions
 from __future__ import print_function, division, absolute_import
 
 import os
-import string
+import re
 import logging
+import weakref
 try:
     from cStringIO import StringIO
 except ImportError:
@@ -22,45 +23,149 @@ try:
     from artella.externals.Qt import QtCore, QtWidgets, QtGui, __binding__
 except ImportError as exc:
     QT_AVAILABLE = False
+    __binding__ = ''
 
-if QT_AVAILABLE:
-    # Some DCCs do not include shiboken, we check all possible locations
-    if __binding__ in ['PySide2', 'PyQt5']:
-        try:
-            import shiboken2 as shiboken
-        except ImportError:
-            from PySide2 import shiboken2 as shiboken
-    else:
-        try:
-            import shiboken
-        except ImportError:
-            try:
-                from Shiboken import shiboken
-            except ImportError:
-                try:
-                    from PySide import shiboken
-                except ImportError:
-                    pass
-
-    # If QApplication does not exists we force its creation
-    try:
-        app = QtWidgets.QApplication.instance()
-        if not app:
-            QtWidgets.QApplication([])
-    except TypeError:
-        QT_AVAILABLE = False
+# Current Qt Python binding checks. Binding does not change during a session, so we only check it once
+IS_PYQT = 'PyQt' in __binding__
+IS_PYQT4 = __binding__ == 'PyQt4'
+IS_PYQT5 = __binding__ == 'PyQt5'
+IS_PYSIDE = __binding__ == 'PySide'
+IS_PYSIDE2 = __binding__ == 'PySide2'
 
 DEFAULT_DPI = 96
 
+# Prefix used by the keys of the pixmaps stored in Qt pixmap cache, to avoid clashes with other applications entries
+PIXMAP_CACHE_KEY_PREFIX = 'artella:'
+
+# Size in kilobytes of Qt pixmap cache. Qt pixmap cache is shared with DCC UI, so we make sure hot icons are not evicted
+PIXMAP_CACHE_LIMIT = 64 * 1024
+
+# Cache of already created icons. Keys are the same ones used by the pixmaps stored in Qt pixmap cache
+_ICONS_CACHE = dict()
+
+# Cache of already loaded style templates. Keys are (style_path, modification time) tuples
+_STYLES_CACHE = dict()
+
+# Cached DPI multiplier of the application. It is reset when application screens change
+_DPI_MULTIPLIER = None
+_DPI_SIGNALS_CONNECTED = False
+
+# Message boxes reused by show message box functions. They are weak referenced, so they are only reused while their
+# parent window keeps them alive
+_MESSAGE_BOXES = weakref.WeakValueDictionary()
+
+# Window flags of input dialogs. They are computed the first time an input dialog is shown
+_INPUT_DIALOG_FLAGS = None
+
+# Cached DCC main window used as default parent of dialogs. It is reset when the window is destroyed
+_MAIN_WINDOW = None
+
+# We never reduce the cache limit set by DCCs
+if QT_AVAILABLE and QtGui.QPixmapCache.cacheLimit() < PIXMAP_CACHE_LIMIT:
+    QtGui.QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT)
+
 if utils.is_python3():
     long = int
 
 logger = logging.getLogger('artella')
 
+# Qt application created by Artella when no Qt application exists
+_APPLICATION = None
+
+# Shiboken module is only imported when Qt objects are wrapped for the first time. False if it is not available.
+_SHIBOKEN = None
+
+# Artella colors module, imported the first time a color is converted from a string
+_COLOR_MODULE = None
+
+# Cache of Qt classes used to wrap objects. Keys are (class name, super class name) tuples of wrapped objects
+_WRAP_BASES_CACHE = dict()
+
+
+class StyleTemplate(object):
+    """
+    Template used by styles, where placeholders are defined with @ delimiter (@name or @{name}) and @@ is an escaped @.
+    Template is split into literal text and placeholders only once, so substitutions do not need to run any regular
+    expression.
+    """
+
+    __slots__ = ('template', '_literals', '_names')
 
-class StyleTemplate(string.Template):
     delimiter = '@'
-    idpattern = r'[_a-z][_a-z0-9]*'
+    pattern = re.compile(
+        r'@(?:(?P<escaped>@)|(?P<named>[_a-z][_a-z0-9]*)|{(?P<braced>[_a-z][_a-z0-9]*)})', re.IGNORECASE)
+
+    def __init__(self, template):
+        self.template = template
+
+        # Literals list always has one more item than the names one; placeholders go between literals.
+        # Names are stored with their placeholder text, so it can be kept by safe substitutions
+        self._literals = list()
+        self._names = list()
+        literal_parts = list()
+        last_index = 0
+        for match in self.pattern.finditer(template):
+            literal_parts.append(template[last_index:match.start()])
+            last_index = match.end()
+            if match.group('escaped') is not None:
+                literal_parts.append(self.delimiter)
+                continue
+            self._literals.append(''.join(literal_parts))
+            self._names.append((match.group('named') or match.group('braced'), match.group()))
+            literal_parts = list()
+        literal_parts.append(template[last_index:])
+        self._literals.append(''.join(literal_parts))
+
+    def substitute(self, mapping=None, **kwargs):
+        """
+        Returns the template with its placeholders replaced by the values of the given mapping
+
+        :param dict mapping: dictionary containing the values of the placeholders
+        :param dict kwargs: placeholders values. They take precedence over the values of the given mapping
+        :return: Template with substituted placeholders. KeyError is raised if a placeholder value is not given
+        :rtype: str
+        """
+
+        return self._substitute(mapping, kwargs, safe=False)
+
+    def safe_substitute(self, mapping=None, **kwargs):
+        """
+        Returns the template with its placeholders replaced by the values of the given mapping.
+        Placeholders with no value are kept in the returned text
+
+        :param dict mapping: dictionary containing the values of the placeholders
+        :param dict kwargs: placeholders values. They take precedence over the values of the given mapping
+        :return: Template with substituted placeholders
+        :rtype: str
+        """
+
+        return self._substitute(mapping, kwargs, safe=True)
+
+    def _substitute(self, mapping, kwargs, safe=False):
+        """
+        Internal function that joins template literals and placeholders values
+        :param dict mapping: dictionary containing the values of the placeholders
+        :param dict kwargs: placeholders values. They take precedence over the values of the given mapping
+        :param bool safe: Whether or not placeholders with no value should be kept instead of raising KeyError
+        :return: Template with substituted placeholders
+        :rtype: str
+        """
+
+        if kwargs:
+            mapping = dict(mapping, **kwargs) if mapping else kwargs
+        elif mapping is None:
+            mapping = dict()
+
+        literals = self._literals
+        parts = [literals[0]]
+        for i, (name, placeholder) in enumerate(self._names):
+            if safe and name not in mapping:
+                parts.append(placeholder)
+            else:
+                parts.append('%s' % (mapping[name],))
+            parts.append(literals[i + 1])
+
+        return ''.join(parts)
 
 
 def is_pyqt():
@@ -71,7 +176,7 @@ def is_pyqt():
     :rtype: bool
     """
 
-    return 'PyQt' in __binding__
+    return IS_PYQT
 
 
 def is_pyqt4():
@@ -82,7 +187,7 @@ def is_pyqt4():
     :rtype: bool
     """
 
-    return __binding__ == 'PyQt4'
+    return IS_PYQT4
 
 
 def is_pyqt5():
@@ -93,7 +198,7 @@ def is_pyqt5():
     :rtype: bool
     """
 
-    return __binding__ == 'PyQt5'
+    return IS_PYQT5
 
 
 def is_pyside():
@@ -104,7 +209,7 @@ def is_pyside():
     :rtype: bool
     """
 
-    return __binding__ == 'PySide'
+    return IS_PYSIDE
 
 
 def is_pyside2():
@@ -115,41 +220,89 @@ def is_pyside2():
     :rtype: bool
     """
 
-    return __binding__ == 'PySide2'
+    return IS_PYSIDE2
+
+
+def _load_shiboken():
+    """
+    Internal function that imports shiboken module the first time it is called
+    :return: shiboken module or None if shiboken is not available
+    :rtype: module or None
+    """
+
+    global _SHIBOKEN
+    if _SHIBOKEN is not None:
+        return _SHIBOKEN or None
+
+    shiboken = None
+    if QT_AVAILABLE:
+        # Some DCCs do not include shiboken, we check all possible locations
+        if __binding__ in ['PySide2', 'PyQt5']:
+            try:
+                import shiboken2 as shiboken
+            except ImportError:
+                try:
+                    from PySide2 import shiboken2 as shiboken
+                except ImportError:
+                    pass
+        else:
+            try:
+                import shiboken
+            except ImportError:
+                try:
+                    from Shiboken import shiboken
+                except ImportError:
+                    try:
+                        from PySide import shiboken
+                    except ImportError:
+                        pass
+
+    _SHIBOKEN = shiboken or False
+
+    return shiboken
 
 
-def wrapinstance(ptr, base=None):
+def wrapinstance(ptr, base=None, base_name=None):
     """
     Wraps given object in a Qt object
     :param ptr:
     :param base: QObject, base QWidget class we want to wrap given object
+    :param str base_name: optional name of the Qt class we want to wrap given object with (such as 'QMainWindow').
+        If given and base is not, object Qt class does not need to be retrieved from the object itself.
     :return:
     """
 
     if ptr is None:
         return None
 
+    if base is None and base_name:
+        base = getattr(QtWidgets, base_name, None) or getattr(QtGui, base_name, None)
+
     ptr = long(ptr)
-    if 'shiboken' in globals():
+    shiboken = _load_shiboken()
+    if shiboken:
         if base is None:
-            qObj = shiboken.wrapInstance(long(ptr), QtCore.QObject)
+            qObj = shiboken.wrapInstance(ptr, QtCore.QObject)
             meta_obj = qObj.metaObject()
             cls = meta_obj.className()
             super_cls = meta_obj.superClass().className()
-            if hasattr(QtGui, cls):
-                base = getattr(QtGui, cls)
-            elif hasattr(QtGui, super_cls):
-                base = getattr(QtGui, super_cls)
-            else:
-                base = QtWidgets.QWidget
+            base = _WRAP_BASES_CACHE.get((cls, super_cls), None)
+            if base is None:
+                if hasattr(QtGui, cls):
+                    base = getattr(QtGui, cls)
+                elif hasattr(QtGui, super_cls):
+                    base = getattr(QtGui, super_cls)
+                else:
+                    base = QtWidgets.QWidget
+                _WRAP_BASES_CACHE[(cls, super_cls)] = base
         try:
-            return shiboken.wrapInstance(long(ptr), base)
+            return shiboken.wrapInstance(ptr, base)
         except Exception:
             from PySide.shiboken import wrapInstance
-            return wrapInstance(long(ptr), base)
+            return wrapInstance(ptr, base)
     elif 'sip' in globals():
         base = QtCore.QObject
-        return shiboken.wrapinstance(long(ptr), base)
+        return shiboken.wrapinstance(ptr, base)
     else:
         logger.error('Failed to wrap object {} ...'.format(ptr))
         return None
@@ -162,6 +315,11 @@ def unwrapinstance(obj):
     :return:
     """
 
+    shiboken = _load_shiboken()
+    if not shiboken:
+        logger.error('Failed to unwrap object {} ...'.format(obj))
+        return None
+
     return long(shiboken.getCppPointer(obj)[0])
 
 
@@ -179,13 +337,40 @@ def to_qt_object(long_ptr, qobj=None):
     return wrapinstance(long_ptr, qobj)
 
 
+def ensure_application():
+    """
+    Returns current Qt application, creating it if it does not exist yet.
+    Qt application is only created when it is needed, to avoid its initialization cost when no UI is used.
+
+    :return: Qt application instance or None if Qt is not available
+    :rtype: QtWidgets.QApplication or None
+    """
+
+    global _APPLICATION
+
+    if not QT_AVAILABLE:
+        return None
+
+    app = QtWidgets.QApplication.instance()
+    if app:
+        return app
+
+    try:
+        _APPLICATION = QtWidgets.QApplication([])
+    except TypeError as exc:
+        logger.warning('Impossible to create Qt application: {}'.format(exc))
+        return None
+
+    return _APPLICATION
+
+
 def get_active_window():
     """
     Returns current active window
     :return:
     """
 
-    if not QT_AVAILABLE:
+    if not ensure_application():
         return None
 
     return QtWidgets.QApplication.activeWindow()
@@ -201,8 +386,20 @@ def icon(icon_path, color=None):
     :rtype: QtGui.QIcon
     """
 
-    icon_pixmap = pixmap(icon_path, color=color)
-    new_icon = QtGui.QIcon(icon_pixmap)
+    color = _get_color(color)
+    icon_key = _get_pixmap_cache_key(icon_path, color)
+    new_icon = _ICONS_CACHE.get(icon_key, None)
+    if new_icon is not None:
+        return new_icon
+
+    ensure_application()
+    if color:
+        new_icon = QtGui.QIcon(pixmap(icon_path, color=color))
+    else:
+        # Icon file is not decoded until the icon is painted for the first time
+        new_icon = QtGui.QIcon(icon_path)
+    if not new_icon.isNull():
+        _ICONS_CACHE[icon_key] = new_icon
 
     return new_icon
 
@@ -217,23 +414,85 @@ def pixmap(pixmap_path, color=None):
     :rtype: QtGui.QPixmap
     """
 
-    if color and isinstance(color, str):
-        from artella.widgets import color as artella_color
-        color = artella_color.from_string(color)
+    color = _get_color(color)
+    pixmap_key = _get_pixmap_cache_key(pixmap_path, color)
+    new_pixmap = find_cached_pixmap(pixmap_key)
+    if new_pixmap is not None:
+        return new_pixmap
 
+    # Pixmaps cannot be created if Qt application does not exists
+    ensure_application()
     new_pixmap = QtGui.QPixmap(pixmap_path)
 
-    if not new_pixmap.isNull() and color:
-        painter = QtGui.QPainter(new_pixmap)
-        painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceIn)
-        painter.setBrush(color)
-        painter.setPen(color)
-        painter.drawRect(new_pixmap.rect())
-        painter.end()
+    if not new_pixmap.isNull():
+        if color:
+            painter = QtGui.QPainter(new_pixmap)
+            painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceIn)
+            painter.setBrush(color)
+            painter.setPen(color)
+            painter.drawRect(new_pixmap.rect())
+            painter.end()
+        QtGui.QPixmapCache.insert(pixmap_key, new_pixmap)
 
     return new_pixmap
 
 
+def _get_color(color):
+    """
+    Internal function that converts given color to a Qt color, if necessary
+    :param str or QtGui.QColor or None color: color to convert
+    :return: Qt color
+    :rtype: QtGui.QColor or None
+    """
+
+    global _COLOR_MODULE
+
+    if color and isinstance(color, str):
+        if _COLOR_MODULE is None:
+            # Colors module imports this module, so it cannot be imported at module level
+            from artella.widgets import color as artella_color
+            _COLOR_MODULE = artella_color
+        color = _COLOR_MODULE.from_string(color)
+
+    return color
+
+
+def _get_pixmap_cache_key(pixmap_path, color=None):
+    """
+    Internal function that returns the key used to cache the pixmap with given path and color
+    :param str pixmap_path: Path were pixmap resource is located
+    :param QtGui.QColor or None color: color used to tint the pixmap
+    :return: Pixmap cache key
+    :rtype: str
+    """
+
+    color_key = color.rgba() if isinstance(color, QtGui.QColor) else color or ''
+
+    return '{}{}:{}'.format(PIXMAP_CACHE_KEY_PREFIX, pixmap_path, color_key)
+
+
+def find_cached_pixmap(pixmap_key):
+    """
+    Returns the pixmap stored in Qt pixmap cache with given key
+    :param str pixmap_key: key of the pixmap to find
+    :return: Cached pixmap or None if the pixmap is not cached
+    :rtype: QtGui.QPixmap or None
+    """
+
+    # PySide (Qt4) only supports the signature that fills the given pixmap
+    if is_pyside():
+        cached_pixmap = QtGui.QPixmap()
+        if not QtGui.QPixmapCache.find(pixmap_key, cached_pixmap):
+            return None
+    else:
+        cached_pixmap = QtGui.QPixmapCache.find(pixmap_key)
+
+    if cached_pixmap is None or cached_pixmap.isNull():
+        return None
+
+    return cached_pixmap
+
+
 def style(style_path):
     """
     Returns Qt style instance
@@ -245,8 +504,14 @@ def style(style_path):
     if not style_path or not os.path.isfile(style_path):
         return loaded_style
 
+    style_key = (style_path, os.path.getmtime(style_path))
+    loaded_style = _STYLES_CACHE.get(style_key, None)
+    if loaded_style is not None:
+        return loaded_style
+
     with open(style_path, 'r') as f:
         loaded_style = StyleTemplate(f.read())
+    _STYLES_CACHE[style_key] = loaded_style
 
     return loaded_style
 
@@ -265,17 +530,14 @@ def show_string_input_dialog(title, label, text='', parent=None):
     :rtype: tuple(str, bool)
     """
 
-    if not QT_AVAILABLE:
+    if not ensure_application():
         return '', False
 
-    from artella import dcc
-
-    parent = parent if parent else dcc.get_main_window()
+    parent = _resolve_parent(parent)
 
-    string_dialog = QtWidgets.QInputDialog()
-    flags = string_dialog.windowFlags() ^ QtCore.Qt.WindowContextHelpButtonHint | QtCore.Qt.WindowStaysOnTopHint
+    flags = _input_dialog_flags()
 
-    typed_string, res = string_dialog.getText(parent, title, label, text=text, flags=flags)
+    typed_string, res = QtWidgets.QInputDialog.getText(parent, title, label, text=text, flags=flags)
 
     return typed_string, res
 
@@ -294,20 +556,17 @@ def show_comment_input_dialog(title, label, text='', parent=None):
     :rtype: tuple(str, bool)
     """
 
-    if not QT_AVAILABLE:
+    if not ensure_application():
         return '', False
 
-    from artella import dcc
-
-    parent = parent if parent else dcc.get_main_window()
+    parent = _resolve_parent(parent)
 
-    comment_dialog = QtWidgets.QInputDialog()
-    flags = comment_dialog.windowFlags() ^ QtCore.Qt.WindowContextHelpButtonHint | QtCore.Qt.WindowStaysOnTopHint
+    flags = _input_dialog_flags()
 
     if hasattr(QtWidgets.QInputDialog, 'getMultiLineText'):
-        comment, res = comment_dialog.getMultiLineText(parent, title, label, text=text, flags=flags)
+        comment, res = QtWidgets.QInputDialog.getMultiLineText(parent, title, label, text=text, flags=flags)
     else:
-        comment, res = comment_dialog.getText(parent, title, label, text, text=text, flags=flags)
+        comment, res = QtWidgets.QInputDialog.getText(parent, title, label, text, text=text, flags=flags)
 
     return comment, res
 
@@ -322,12 +581,10 @@ def show_info_message_box(title, text, parent=None):
         window will be used.
     """
 
-    if not QT_AVAILABLE:
+    if not ensure_application():
         return
 
-    from artella import dcc
-
-    parent = parent if parent else dcc.get_main_window()
+    parent = _resolve_parent(parent)
 
     QtWidgets.QMessageBox.information(parent, title, text)
 
@@ -346,18 +603,15 @@ def show_question_message_box(title, text, cancel=True, parent=None):
     :rtype: bool or None
     """
 
-    if not QT_AVAILABLE:
+    if not ensure_application():
         return None
 
-    from artella import dcc
-
-    parent = parent if parent else dcc.get_main_window()
+    parent = _resolve_parent(parent)
 
-    message_box = QtWidgets.QMessageBox(parent)
+    message_box = _get_message_box('question', parent)
     message_box.setWindowTitle(title)
-    flags = message_box.windowFlags() ^ QtCore.Qt.WindowContextHelpButtonHint | QtCore.Qt.WindowStaysOnTopHint
-    if text:
-        message_box.setText(text)
+    flags = _dialog_flags(message_box)
+    message_box.setText(text or '')
     if cancel:
         message_box.setStandardButtons(
             QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No | QtWidgets.QMessageBox.Cancel)
@@ -365,6 +619,7 @@ def show_question_message_box(title, text, cancel=True, parent=None):
         message_box.setStandardButtons(QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
     message_box.setWindowFlags(flags)
     result = message_box.exec_()
+    _release_message_box('question', message_box)
 
     if result == QtWidgets.QMessageBox.Yes:
         return True
@@ -384,56 +639,157 @@ def show_warning_message_box(title, text, parent=None):
         window will be used.
     """
 
-    if not QT_AVAILABLE:
-        return
+    _show_ok_message_box('warning', title, text, parent=parent)
 
-    from artella import dcc
-    from artella.core import resource
 
-    parent = parent if parent else dcc.get_main_window()
-    window_icon = resource.icon('artella')
+def show_error_message_box(title, text, parent=None):
+    """
+    Shows an error message box that can be used to show critical text to users.
 
-    message_box = QtWidgets.QMessageBox(parent)
-    message_box.setWindowTitle(title)
-    message_box.setWindowIcon(window_icon)
-    message_box.setIcon(message_box.Icon.Warning)
-    flags = message_box.windowFlags() ^ QtCore.Qt.WindowContextHelpButtonHint | QtCore.Qt.WindowStaysOnTopHint
-    if text:
-        message_box.setText(text)
-    message_box.setStandardButtons(QtWidgets.QMessageBox.Ok)
-    message_box.setWindowFlags(flags)
-    message_box.exec_()
+    :param str title: text that is displayed in the title bar of the dialog
+    :param str text: default text which is placed n the plain text edit
+    :param QWidget parent: optional parent widget for the input text dialog. If not given, current DCC main parent
+        window will be used.
+    """
 
+    _show_ok_message_box('error', title, text, parent=parent)
 
-def show_error_message_box(title, text, parent=None):
+
+def _show_ok_message_box(message_box_type, title, text, parent=None):
     """
-    Shows an error message box that can be used to show critical text to users.
+    Internal function that shows a message box with an Ok button used to show warning or error messages to users.
 
+    :param str message_box_type: type of the message box to show ('warning' or 'error')
     :param str title: text that is displayed in the title bar of the dialog
     :param str text: default text which is placed n the plain text edit
     :param QWidget parent: optional parent widget for the input text dialog. If not given, current DCC main parent
         window will be used.
     """
 
-    if not QT_AVAILABLE:
+    if not ensure_application():
         return
 
-    from artella import dcc
     from artella.core import resource
 
-    parent = parent if parent else dcc.get_main_window()
+    parent = _resolve_parent(parent)
     window_icon = resource.icon('artella')
 
-    message_box = QtWidgets.QMessageBox(parent)
+    message_box = _get_message_box(message_box_type, parent)
     message_box.setWindowTitle(title)
     message_box.setWindowIcon(window_icon)
-    message_box.setIcon(message_box.Icon.Critical)
-    flags = message_box.windowFlags() ^ QtCore.Qt.WindowContextHelpButtonHint | QtCore.Qt.WindowStaysOnTopHint
-    if text:
-        message_box.setText(text)
+    if message_box_type == 'error':
+        message_box.setIcon(message_box.Icon.Critical)
+    else:
+        message_box.setIcon(message_box.Icon.Warning)
+    flags = _dialog_flags(message_box)
+    message_box.setText(text or '')
     message_box.setStandardButtons(QtWidgets.QMessageBox.Ok)
     message_box.setWindowFlags(flags)
     message_box.exec_()
+    _release_message_box(message_box_type, message_box)
+
+
+def _dialog_flags(dialog):
+    """
+    Internal function that returns the window flags used by dialogs: no context help button and always on top
+    :param QtWidgets.QDialog dialog: dialog to get flags of
+    :return: Dialog window flags
+    :rtype: QtCore.Qt.WindowFlags
+    """
+
+    return dialog.windowFlags() ^ QtCore.Qt.WindowContextHelpButtonHint | QtCore.Qt.WindowStaysOnTopHint
+
+
+def _input_dialog_flags():
+    """
+    Internal function that returns the window flags used by input dialogs.
+    Flags are cached, so an input dialog is only created the first time to read its default flags
+    :return: Input dialog window flags
+    :rtype: QtCore.Qt.WindowFlags
+    """
+
+    global _INPUT_DIALOG_FLAGS
+    if _INPUT_DIALOG_FLAGS is None:
+        _INPUT_DIALOG_FLAGS = _dialog_flags(QtWidgets.QInputDialog())
+
+    return _INPUT_DIALOG_FLAGS
+
+
+def _resolve_parent(parent=None):
+    """
+    Internal function that returns the parent that should be used by dialogs
+    :param QWidget parent: parent widget. If not given, current DCC main window will be used.
+    :return: Dialog parent widget
+    :rtype: QWidget or None
+    """
+
+    global _MAIN_WINDOW
+
+    if parent:
+        return parent
+    if _MAIN_WINDOW is not None:
+        return _MAIN_WINDOW
+
+    from artella import dcc
+
+    main_window = dcc.get_main_window()
+    if main_window is not None:
+        _MAIN_WINDOW = main_window
+        main_window.destroyed.connect(_reset_main_window)
+
+    return main_window
+
+
+def _reset_main_window(*args):
+    """
+    Internal function that resets cached DCC main window
+    """
+
+    global _MAIN_WINDOW
+    _MAIN_WINDOW = None
+
+
+def _get_message_box(message_box_type, parent=None):
+    """
+    Internal function that returns the message box used to show messages of the given type.
+    Message boxes are created the first time they are requested and reused later. If the cached message box is
+    still visible (for example, a message is requested from a deferred callback while the message box is executed),
+    a new message box, that is not cached, is returned.
+    :param str message_box_type: type of the message box to retrieve ('question', 'warning' or 'error')
+    :param QWidget parent: parent widget for the message box
+    :return: Message box instance
+    :rtype: QtWidgets.QMessageBox
+    """
+
+    message_box = _MESSAGE_BOXES.get(message_box_type, None)
+    if message_box is not None:
+        try:
+            if message_box.isVisible():
+                return QtWidgets.QMessageBox(parent)
+            # Setting the parent resets window flags, so the flags set by message box constructor are restored
+            message_box.setParent(parent, message_box.default_window_flags)
+            return message_box
+        except RuntimeError:
+            # Internal C++ object was already deleted (for example, its previous parent was deleted)
+            pass
+
+    message_box = QtWidgets.QMessageBox(parent)
+    message_box.default_window_flags = message_box.windowFlags()
+    _MESSAGE_BOXES[message_box_type] = message_box
+
+    return message_box
+
+
+def _release_message_box(message_box_type, message_box):
+    """
+    Internal function that deletes given message box once it is closed, if it is not the cached message box of the
+    given type
+    :param str message_box_type: type of the message box ('question', 'warning' or 'error')
+    :param QtWidgets.QMessageBox message_box: message box to release
+    """
+
+    if _MESSAGE_BOXES.get(message_box_type, None) is not message_box:
+        message_box.deleteLater()
 
 
 def dpi_multiplier():
@@ -443,7 +799,36 @@ def dpi_multiplier():
     :return: float
     """
 
-    return max(1, float(QtWidgets.QApplication.desktop().logicalDpiY()) / float(DEFAULT_DPI))
+    global _DPI_MULTIPLIER, _DPI_SIGNALS_CONNECTED
+    if _DPI_MULTIPLIER is not None:
+        return _DPI_MULTIPLIER
+
+    app = ensure_application()
+    primary_screen = app.primaryScreen() if hasattr(app, 'primaryScreen') else None
+    if primary_screen:
+        logical_dpi = primary_screen.logicalDotsPerInchY()
+    else:
+        logical_dpi = QtWidgets.QApplication.desktop().logicalDpiY()
+    _DPI_MULTIPLIER = max(1, float(logical_dpi) / float(DEFAULT_DPI))
+
+    # Screen signals are only available in Qt5
+    if primary_screen and not _DPI_SIGNALS_CONNECTED:
+        _DPI_SIGNALS_CONNECTED = True
+        for screen_signal_name in ('screenAdded', 'screenRemoved', 'primaryScreenChanged'):
+            screen_signal = getattr(app, screen_signal_name, None)
+            if screen_signal is not None:
+                screen_signal.connect(_reset_dpi_multiplier)
+
+    return _DPI_MULTIPLIER
+
+
+def _reset_dpi_multiplier(*args):
+    """
+    Internal function that resets cached DPI multiplier, so it is computed again the next time is requested
+    """
+
+    global _DPI_MULTIPLIER
+    _DPI_MULTIPLIER = None
 
 
 def dpi_scale(value):
@@ -465,12 +850,19 @@ def clear_layout(layout):
     :param layout: QLayout
     """
 
-    while layout.count():
-        child = layout.takeAt(0)
-        if child.widget() is not None:
-            child.widget().deleteLater()
-        elif child.layout() is not None:
-            clear_layout(child.layout())
+    # Nested layouts are cleared using a stack to avoid recursion
+    layouts = [layout]
+    while layouts:
+        current_layout = layouts.pop()
+        while current_layout.count():
+            child = current_layout.takeAt(0)
+            child_widget = child.widget()
+            if child_widget is not None:
+                child_widget.deleteLater()
+            else:
+                child_layout = child.layout()
+                if child_layout is not None:
+                    layouts.append(child_layout)
 
 
 def is_stackable(widget):
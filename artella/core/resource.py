@@ -8,6 +8,11 @@ Module that contains ArtellaDrive Qt related utils classes and functions
 from __future__ import print_function, division, absolute_import
 
 import os
+import threading
+try:
+    from os import scandir
+except ImportError:
+    scandir = None
 
 from artella import dcc
 from artella.core import utils, qtutils
@@ -22,9 +27,47 @@ class ResourceTypes(object):
     STYLE = 'style'
 
 
+# Folders, relative to resources paths, where resources files are usually located
+RESOURCES_FOLDERS = ('', 'icons', 'images', 'styles')
+
 _RESOURCES_PATHS = list()
+
+# Index of the files located inside registered resources paths. Keys are (name, extension) tuples.
+# It is built the first time a resource is requested and reset when a new resources path is registered.
+_RESOURCES_INDEX = None
+
+# Resources files, as (name, extension) tuples, that are not found in any registered resources path.
+# It is reset when a new resources path is registered.
+_MISSING_RESOURCES = set()
+
+# Maximum number of resources cached per resource type. Each color variant of a resource is cached separately, so
+# we bound the cache to avoid growing it during the whole session. Oldest resources are removed first.
+_RESOURCES_CACHE_MAX_SIZE = 512
+
 _RESOURCES_CACHE = {
-    ResourceTypes.ICON: dict(), ResourceTypes.PIXMAP: dict(), ResourceTypes.STYLE: dict()
+    ResourceTypes.ICON: utils.BoundedDict(_RESOURCES_CACHE_MAX_SIZE),
+    ResourceTypes.PIXMAP: utils.BoundedDict(_RESOURCES_CACHE_MAX_SIZE),
+    ResourceTypes.STYLE: utils.BoundedDict(_RESOURCES_CACHE_MAX_SIZE)
+}
+
+# Empty icon and pixmap returned when requested resources are not found. Same as cached resources, they are shared
+# by all callers, so they should not be modified. They are created on demand because pixmaps cannot be created
+# before Qt application
+_EMPTY_ICON = None
+_EMPTY_PIXMAP = None
+
+# Functions that load resources from their file paths. They receive the resource file path and the resource color
+_RESOURCE_LOADERS = {
+    ResourceTypes.ICON: lambda res_path, color: qtutils.icon(res_path, color=color),
+    ResourceTypes.PIXMAP: lambda res_path, color: qtutils.pixmap(res_path, color=color),
+    ResourceTypes.STYLE: lambda res_path, color: qtutils.style(res_path)
+}
+
+# Functions that check whether or not a loaded resource is valid, and therefore, can be cached
+_RESOURCE_VALIDATORS = {
+    ResourceTypes.ICON: lambda res: not res.isNull(),
+    ResourceTypes.PIXMAP: lambda res: not res.isNull(),
+    ResourceTypes.STYLE: bool
 }
 
 
@@ -42,6 +85,26 @@ def register_resources_path(resources_path):
         return
 
     _RESOURCES_PATHS.append(resources_path)
+    _reset_resources_index()
+
+    register_dcc_resources_path(resources_path)
+
+
+def rebuild_index():
+    """
+    Rebuilds the index of the files located inside registered resources paths.
+    Useful when resources files are added or removed while developing.
+    """
+
+    _reset_resources_index()
+    _get_resources_index()
+
+
+def register_dcc_resources_path(resources_path):
+    """
+    Registers a resources path, and its icons folder if it exists, in current DCC so DCC can find resources in it
+    :param str resources_path: Path where resources are located
+    """
 
     dcc.register_dcc_resource_path(resources_path)
     icons_path = os.path.join(resources_path, 'icons')
@@ -56,44 +119,185 @@ def get(resource_type, name, extension, **kwargs):
     :return: object
     """
 
-    color = kwargs.get('color', '')
-    file_name = '{}{}'.format(name, extension)
-    file_key = '{}{}'.format(file_name.lower(), color)
-
     if not qtutils.QT_AVAILABLE or not _RESOURCES_PATHS or resource_type not in _RESOURCES_CACHE:
         return None
 
-    if not extension.startswith('.'):
-        extension = '.{}'.format(extension)
+    # Extension is normalized before building the cache key, so 'png' and '.png' extensions share cache entries.
+    # Resources files are found using case sensitive names, so cache keys are case sensitive too.
+    extension = _normalize_extension(extension)
+    color = kwargs.get('color', None) or ''
+    file_key = name + extension + str(color)
+
+    resources_cache = _RESOURCES_CACHE[resource_type]
+    if file_key in resources_cache:
+        return resources_cache[file_key]
+
+    if (name, extension) in _MISSING_RESOURCES:
+        return None
+
+    res_path = _find_resource_path(name, extension)
+    if not res_path:
+        _MISSING_RESOURCES.add((name, extension))
+        return None
+
+    # Empty files (for example, files that are still being synced) are not loaded
+    try:
+        if not os.path.getsize(res_path):
+            return None
+    except OSError:
+        return None
+
+    new_res = _RESOURCE_LOADERS[resource_type](res_path, color)
+    if not new_res:
+        return None
+
+    if _RESOURCE_VALIDATORS[resource_type](new_res):
+        resources_cache[file_key] = new_res
+
+    return new_res
+
+
+def find_path(name, extensions=('png', 'svg', 'ico')):
+    """
+    Returns the path of the resource file with given name and any of the given extensions
+    :param str name: name of the resource file without extension
+    :param tuple(str) extensions: extensions of the resource file, in priority order
+    :return: Absolute path of the first resource file found or None if no resource file is found
+    :rtype: str or None
+    """
+
+    if not _RESOURCES_PATHS:
+        return None
+
+    for extension in extensions:
+        extension = _normalize_extension(extension)
+        if (name, extension) in _MISSING_RESOURCES:
+            continue
+        res_path = _find_resource_path(name, extension)
+        if res_path:
+            return res_path
+        _MISSING_RESOURCES.add((name, extension))
 
-    if file_key in _RESOURCES_CACHE[resource_type]:
-        return _RESOURCES_CACHE[resource_type][file_key]
+    return None
+
+
+def _normalize_extension(extension):
+    """
+    Internal function that returns given extension starting with a dot
+    :param str extension: extension to normalize ('png' or '.png')
+    :return: Normalized extension
+    :rtype: str
+    """
+
+    return extension if extension.startswith('.') else '.' + extension
+
+
+def _find_resource_path(name, extension):
+    """
+    Internal function that returns the path of the resource file with given name and extension.
+    Resources folders are checked first, so resources paths only need to be indexed when a resource file is
+    located in another folder.
+    :param str name: name of the resource file without extension
+    :param str extension: extension of the resource file (with the dot)
+    :return: Absolute path of the resource file or None if the file is not found
+    :rtype: str or None
+    """
 
+    file_name = name + extension
     for resource_path in _RESOURCES_PATHS:
+        for resource_folder in RESOURCES_FOLDERS:
+            res_path = os.path.join(resource_path, resource_folder, file_name)
+            if os.path.isfile(res_path):
+                return res_path
+
+    return _get_resources_index().get((name, extension), None)
+
+
+def _reset_resources_index():
+    """
+    Internal function that resets the index of the files located inside registered resources paths and the
+    missing resources cache
+    """
+
+    global _RESOURCES_INDEX
+
+    _RESOURCES_INDEX = None
+    _MISSING_RESOURCES.clear()
+
+
+def _get_resources_index():
+    """
+    Internal function that returns the index of the files located inside registered resources paths.
+    If a file is found in multiple resources paths, the one inside the first registered path is used.
+    :return: Dictionary mapping (name, extension) tuples to resource file paths
+    :rtype: dict(tuple(str, str), str)
+    """
+
+    global _RESOURCES_INDEX
+
+    if _RESOURCES_INDEX is not None:
+        return _RESOURCES_INDEX
+
+    resources_paths = list(_RESOURCES_PATHS)
+    paths_indexes = [None] * len(resources_paths)
+
+    def _index_path(path_index):
+        paths_indexes[path_index] = _index_resources_path(resources_paths[path_index])
+
+    # Resources paths are walked in parallel, because walking them is mostly waiting for file system calls
+    if len(resources_paths) > 1:
+        index_threads = [
+            threading.Thread(target=_index_path, args=(i,)) for i in range(len(resources_paths))]
+        for index_thread in index_threads:
+            index_thread.start()
+        for index_thread in index_threads:
+            index_thread.join()
+    elif resources_paths:
+        _index_path(0)
+
+    # Indexes are merged in registration order, so files in first registered paths take precedence
+    resources_index = dict()
+    for path_index in paths_indexes:
+        for file_key, file_path in (path_index or dict()).items():
+            resources_index.setdefault(file_key, file_path)
+    _RESOURCES_INDEX = resources_index
+
+    return _RESOURCES_INDEX
+
+
+def _index_resources_path(resource_path):
+    """
+    Internal function that returns the index of the files located inside given resources path
+    :param str resource_path: resources path to index
+    :return: Dictionary mapping (name, extension) tuples to resource file paths
+    :rtype: dict(tuple(str, str), str)
+    """
+
+    path_index = dict()
+
+    if scandir is None:
         for root, dirs, files in os.walk(resource_path):
             for path in files:
-                path_name, path_ext = os.path.splitext(path)
-                if path_name == name and path_ext == extension:
-                    res_path = os.path.join(root, path)
-                    new_res = None
-                    if resource_type == ResourceTypes.ICON:
-                        new_res = qtutils.icon(res_path, color=color)
-                    elif resource_type == ResourceTypes.PIXMAP:
-                        new_res = qtutils.pixmap(res_path, color=color)
-                    elif resource_type == ResourceTypes.STYLE:
-                        new_res = qtutils.style(res_path)
-                    if not new_res:
-                        return None
-
-                    if hasattr(new_res, 'isNull'):
-                        if not new_res.isNull():
-                            _RESOURCES_CACHE[resource_type][file_key] = new_res
-                    else:
-                        _RESOURCES_CACHE[resource_type][file_key] = new_res
-
-                    return new_res
-
-    return None
+                path_index.setdefault(os.path.splitext(path), os.path.join(root, path))
+        return path_index
+
+    # Folders are visited in the same order os.walk does, so the same file is found when it is duplicated
+    folders = [resource_path]
+    while folders:
+        sub_folders = list()
+        try:
+            for entry in scandir(folders.pop()):
+                if entry.is_dir():
+                    # Same as os.walk, we do not follow folders symbolic links
+                    if not entry.is_symlink():
+                        sub_folders.append(entry.path)
+                else:
+                    path_index.setdefault(os.path.splitext(entry.name), entry.path)
+        except OSError:
+            continue
+        folders.extend(reversed(sub_folders))
+
+    return path_index
 
 
 def icon(name, extension='png', color=None):
@@ -105,9 +309,15 @@ def icon(name, extension='png', color=None):
     :return: QIcon
     """
 
+    global _EMPTY_ICON
+
     new_icon = get(ResourceTypes.ICON, name=name, extension=extension, color=color)
     if not new_icon:
-        return None if not qtutils.QT_AVAILABLE else QtGui.QIcon()
+        if not qtutils.QT_AVAILABLE:
+            return None
+        if _EMPTY_ICON is None:
+            _EMPTY_ICON = QtGui.QIcon()
+        return _EMPTY_ICON
 
     return new_icon
 
@@ -121,9 +331,15 @@ def pixmap(name, extension='png', color=None):
     :return:
     """
 
+    global _EMPTY_PIXMAP
+
     new_pixmap = get(ResourceTypes.PIXMAP, name=name, extension=extension, color=color)
     if not new_pixmap:
-        return None if not qtutils.QT_AVAILABLE else QtGui.QPixmap()
+        if not qtutils.QT_AVAILABLE:
+            return None
+        if _EMPTY_PIXMAP is None:
+            _EMPTY_PIXMAP = QtGui.QPixmap()
+        return _EMPTY_PIXMAP
 
     return new_pixmap
 
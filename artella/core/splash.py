@@ -20,6 +20,88 @@ if qtutils.QT_AVAILABLE:
 
 logger = logging.getLogger('artella')
 
+# Masks of splash pixmaps. Keys are pixmap cache keys
+_SPLASH_MASKS = dict()
+
+# Splash pixmaps with their drop shadow already rendered. Keys are (pixmap cache key, blur radius, margin) tuples
+_SHADOW_PIXMAPS = dict()
+
+
+def _get_splash_mask(splash_pixmap):
+    """
+    Internal function that returns the mask of the given splash pixmap.
+    Computing a mask checks all pixmap pixels, so masks are computed only once per pixmap.
+    :param QtGui.QPixmap splash_pixmap: pixmap to retrieve mask of
+    :return: Pixmap mask
+    :rtype: QtGui.QBitmap
+    """
+
+    cache_key = splash_pixmap.cacheKey()
+    if cache_key not in _SPLASH_MASKS:
+        _SPLASH_MASKS[cache_key] = splash_pixmap.mask()
+
+    return _SPLASH_MASKS[cache_key]
+
+
+def _get_shadow_pixmap(source_pixmap, blur_radius, margin):
+    """
+    Internal function that returns a pixmap with given pixmap and its drop shadow rendered in it.
+    Shadow is rendered only once, so splash dialogs do not need to blur their contents every time they are painted.
+    :param QtGui.QPixmap source_pixmap: pixmap to render drop shadow of
+    :param int blur_radius: drop shadow blur radius
+    :param int margin: space, around the pixmap, where drop shadow is rendered
+    :return: Pixmap with the drop shadow
+    :rtype: QtGui.QPixmap
+    """
+
+    cache_key = (source_pixmap.cacheKey(), blur_radius, margin)
+    if cache_key in _SHADOW_PIXMAPS:
+        return _SHADOW_PIXMAPS[cache_key]
+
+    shadow_effect = QtWidgets.QGraphicsDropShadowEffect()
+    shadow_effect.setBlurRadius(blur_radius)
+    shadow_effect.setColor(QtGui.QColor(0, 0, 0, 150))
+    shadow_effect.setOffset(0)
+    pixmap_item = QtWidgets.QGraphicsPixmapItem(source_pixmap)
+    pixmap_item.setGraphicsEffect(shadow_effect)
+    scene = QtWidgets.QGraphicsScene()
+    scene.addItem(pixmap_item)
+
+    # Shadow is rendered into a premultiplied alpha image, which is the format translucent windows are composited
+    # with, so the pixmap can be blitted without converting it every time the dialog is painted
+    width = source_pixmap.width() + margin * 2
+    height = source_pixmap.height() + margin * 2
+    shadow_image = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32_Premultiplied)
+    shadow_image.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(shadow_image)
+    painter.setRenderHints(QtGui.QPainter.Antialiasing | QtGui.QPainter.SmoothPixmapTransform)
+    scene.render(
+        painter, QtCore.QRectF(0, 0, width, height), QtCore.QRectF(-margin, -margin, width, height))
+    painter.end()
+    shadow_pixmap = QtGui.QPixmap.fromImage(shadow_image)
+
+    _SHADOW_PIXMAPS[cache_key] = shadow_pixmap
+
+    return shadow_pixmap
+
+
+def _get_arc_path(rect, start_angle, sweep_angle):
+    """
+    Internal function that returns a path with an arc
+    :param QtCore.QRect rect: rectangle the arc ellipse is inscribed in
+    :param float start_angle: arc start angle in degrees
+    :param float sweep_angle: arc sweep angle in degrees
+    :return: Arc path
+    :rtype: QtGui.QPainterPath
+    """
+
+    arc_rect = QtCore.QRectF(rect)
+    arc_path = QtGui.QPainterPath()
+    arc_path.arcMoveTo(arc_rect, start_angle)
+    arc_path.arcTo(arc_rect, start_angle, sweep_angle)
+
+    return arc_path
+
 
 if not qtutils.QT_AVAILABLE:
     class SplashScreen(object):
@@ -29,6 +111,65 @@ if not qtutils.QT_AVAILABLE:
     class ProgressCricle(object):
         def __init__(self, *args, **kwargs):
             pass
+
+    # Splash dialogs cannot be shown without Qt, so their functions do nothing
+    class SplashDialog(object):
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def setup_ui(self):
+            pass
+
+        def exec_(self):
+            pass
+
+    class InfoSplashDialog(SplashDialog, object):
+        def set_text(self, text):
+            pass
+
+    class ProgressSplashDialog(SplashDialog, object):
+        def set_progress_text(self, text):
+            pass
+
+        def set_infinite(self, flag):
+            pass
+
+        def start(self, reset=True, infinite=False):
+            pass
+
+        def end(self):
+            pass
+
+        def get_min_progress_value(self):
+            return 0
+
+        def get_max_progress_value(self):
+            return 100
+
+        def set_min_progress_value(self, min_value):
+            pass
+
+        def set_max_progress_value(self, max_value):
+            pass
+
+        def get_progress_value(self):
+            return 0
+
+        def set_progress_value(self, value, status=''):
+            pass
+
+        def is_cancelled(self):
+            return False
+
+    class DownloadSplashDialog(ProgressSplashDialog, object):
+        def __init__(self, downloader, parent=None, **kwargs):
+            super(DownloadSplashDialog, self).__init__(parent, **kwargs)
+
+        def download(self, file_paths):
+            pass
+
+        def update_download(self, file_path, status, progress):
+            pass
 else:
     class SplashScreen(QtWidgets.QSplashScreen, object):
         def __init__(self, *args, **kwargs):
@@ -42,8 +183,16 @@ else:
             super(ProgressCricle, self).__init__(parent)
 
             self._infinite = False
-            self._timer = QtCore.QTimer(self)
-            self._timer.timeout.connect(self._on_increase_value)
+            self._infinite_percent = 0.0
+
+            # In infinite mode only the painted arc is animated, progress value is not modified. Same speed as
+            # previous implementation, where progress value was increased every 15 milliseconds
+            self._infinite_animation = QtCore.QVariantAnimation(self)
+            self._infinite_animation.setDuration(1500)
+            self._infinite_animation.setStartValue(0.0)
+            self._infinite_animation.setEndValue(100.0)
+            self._infinite_animation.setLoopCount(-1)
+            self._infinite_animation.valueChanged.connect(self._on_infinite_value_changed)
 
             self._main_layout = QtWidgets.QHBoxLayout()
             self._default_label = QtWidgets.QLabel()
@@ -51,7 +200,7 @@ else:
             self._main_layout.addWidget(self._default_label)
             self.setLayout(self._main_layout)
             self._color = QtGui.QColor(221, 235, 230)
-            self._width = kwargs.get('width', 140)
+            self._width = int(kwargs.get('width', 140))
 
             self.setTextDirection(self.Direction.BottomToTop)
 
@@ -62,308 +211,763 @@ else:
 
             self.setFixedSize(QtCore.QSize(self._width * self._width_factor, self._width * self._height_factor))
 
+            # Circle geometry and pens only depend on the circle width, so we create them once
+            self._pen_width = int(3 * self._width / 50.0)
+            self._radius = self._width - self._pen_width - 1
+            # Integer geometry, so arcs are drawn using Qt integer overloads
+            arc_origin = self._pen_width // 2 + 1
+            self._arc_rect = QtCore.QRect(arc_origin, arc_origin, self._radius, self._radius)
+            self._background_path = _get_arc_path(
+                self._arc_rect, self._start_angle / 16.0, -self._max_delta_angle / 16.0)
+
+            # Area where the circle is painted. Animation frames only invalidate this area
+            self._circle_rect = QtCore.QRect(0, 0, self._width, self._width)
+            self._pen_background = QtGui.QPen()
+            self._pen_background.setWidth(self._pen_width)
+            self._pen_background.setColor(QtGui.QColor(80, 120, 110))
+            self._pen_background.setCapStyle(QtCore.Qt.RoundCap)
+            self._pen_foreground = QtGui.QPen()
+            self._pen_foreground.setWidth(self._pen_width)
+            self._pen_foreground.setColor(self._color)
+            self._pen_foreground.setCapStyle(QtCore.Qt.RoundCap)
+
+            # Label and drawn percentage are updated when progress changes, instead of every time the circle is
+            # painted
+            self._percent = 0
+            self.valueChanged.connect(self._on_progress_changed)
+            self._on_progress_changed()
+
         @property
         def infinite(self):
             return self._infinite
 
+        def set_color(self, color):
+            """
+            Sets the color of the progress circle foreground
+            :param QtGui.QColor color: foreground color
+            """
+
+            self._color = color
+            self._pen_foreground.setColor(color)
+            self.update()
+
+        def setFormat(self, format):
+            super(ProgressCricle, self).setFormat(format)
+            self._sync_label_text()
+
+        def setRange(self, minimum, maximum):
+            super(ProgressCricle, self).setRange(minimum, maximum)
+            self._on_progress_changed()
+
+        def setMinimum(self, minimum):
+            super(ProgressCricle, self).setMinimum(minimum)
+            self._on_progress_changed()
+
+        def setMaximum(self, maximum):
+            super(ProgressCricle, self).setMaximum(maximum)
+            self._on_progress_changed()
+
+        def setTextVisible(self, flag):
+            super(ProgressCricle, self).setTextVisible(flag)
+            self._default_label.setVisible(flag)
+
         def set_widget(self, widget):
             self.setTextVisible(False)
             self._main_layout.addWidget(widget)
 
         def set_infinite(self, flag):
-            self._timer.stop()
-            if flag:
-                self._timer.start(15)
+            self._infinite_animation.stop()
             self._infinite = flag
+            if flag:
+                self._infinite_animation.start()
+            self.update()
 
         def paintEvent(self, event):
-            if self.text() != self._default_label.text():
-                self._default_label.setText(self.text())
-            if self.isTextVisible() != self._default_label.isVisible():
-                self._default_label.setVisible(self.isTextVisible())
-
-            percent = utils.get_percent(self.value(), self.minimum(), self.maximum())
-            total_width = self._width
-            pen_width = int(3 * total_width / 50.0)
-            radius = total_width - pen_width - 1
-
+            # QProgressBar paint event is not called on purpose: progress groove and text are not drawn by the style
+            # (progress text is displayed by the default label), so only the cached circle pixmap is painted
+            percent = int(self._infinite_percent) if self._infinite else self._percent
+
+            # Only the invalidated area of the circle is painted
+            exposed_rect = event.rect().intersected(self._circle_rect)
+            if exposed_rect.isEmpty():
+                return
+            # Circle pixmap is rendered at device resolution, so source rectangle is defined in device pixels
+            pixel_ratio = self._get_device_pixel_ratio()
+            source_rect = QtCore.QRectF(
+                exposed_rect.x() * pixel_ratio, exposed_rect.y() * pixel_ratio,
+                exposed_rect.width() * pixel_ratio, exposed_rect.height() * pixel_ratio)
             painter = QtGui.QPainter(self)
+            painter.drawPixmap(QtCore.QRectF(exposed_rect), self._get_circle_pixmap(percent, pixel_ratio), source_rect)
+            painter.end()
+
+        def _get_device_pixel_ratio(self):
+            """
+            Internal function that returns the ratio between physical pixels and logical pixels of the progress circle
+            :return: Device pixel ratio (1.0 if Qt does not support HiDPI pixmaps)
+            :rtype: float
+            """
+
+            if hasattr(self, 'devicePixelRatioF'):
+                return self.devicePixelRatioF()
+
+            return float(self.devicePixelRatio()) if hasattr(self, 'devicePixelRatio') else 1.0
+
+        def _get_circle_pixmap(self, percent, pixel_ratio=1.0):
+            """
+            Internal function that returns the pixmap of the progress circle for the given percentage.
+            Circle can only be drawn in 101 different ways, so circle pixmaps are stored in Qt pixmap cache instead of
+            drawing antialiased arcs every time the progress circle is painted.
+            :param int percent: progress percentage (from 0 to 100)
+            :param float pixel_ratio: device pixel ratio the pixmap is rendered with
+            :return: Pixmap of the progress circle
+            :rtype: QtGui.QPixmap
+            """
+
+            # Color, width and pixel ratio are part of the key, so changing them (for example, moving the widget to
+            # a screen with a different scale) does not require to invalidate cached pixmaps
+            pixmap_key = '{}progress_circle:{}:{}:{}:{}'.format(
+                qtutils.PIXMAP_CACHE_KEY_PREFIX, self._width, self._color.rgba(), pixel_ratio, percent)
+            circle_pixmap = qtutils.find_cached_pixmap(pixmap_key)
+            if circle_pixmap is not None:
+                return circle_pixmap
+
+            # Painter coordinates are logical ones once pixmap device pixel ratio is set, so paths do not need to be
+            # scaled
+            pixmap_size = int(round(self._width * pixel_ratio))
+            circle_pixmap = QtGui.QPixmap(pixmap_size, pixmap_size)
+            if hasattr(circle_pixmap, 'setDevicePixelRatio'):
+                circle_pixmap.setDevicePixelRatio(pixel_ratio)
+            circle_pixmap.fill(QtCore.Qt.transparent)
+            painter = QtGui.QPainter(circle_pixmap)
             painter.setRenderHints(QtGui.QPainter.Antialiasing)
 
             # draw background circle
-            pen_background = QtGui.QPen()
-            pen_background.setWidth(pen_width)
-            pen_background.setColor(QtGui.QColor(80, 120, 110))
-            pen_background.setCapStyle(QtCore.Qt.RoundCap)
-            painter.setPen(pen_background)
-            painter.drawArc(pen_width / 2.0 + 1,
-                            pen_width / 2.0 + 1,
-                            radius,
-                            radius,
-                            self._start_angle,
-                            -self._max_delta_angle)
+            painter.strokePath(self._background_path, self._pen_background)
 
             # draw foreground circle
-            pen_foreground = QtGui.QPen()
-            pen_foreground.setWidth(pen_width)
-            pen_foreground.setColor(self._color)
-            pen_foreground.setCapStyle(QtCore.Qt.RoundCap)
-            painter.setPen(pen_foreground)
-            painter.drawArc(
-                pen_width / 2.0 + 1, pen_width / 2.0 + 1, radius, radius,
-                self._start_angle, -percent * 0.01 * self._max_delta_angle)
+            if percent:
+                foreground_path = _get_arc_path(
+                    self._arc_rect, self._start_angle / 16.0, -percent * 0.01 * self._max_delta_angle / 16.0)
+                painter.strokePath(foreground_path, self._pen_foreground)
             painter.end()
 
-        def _on_increase_value(self):
-            new_value = self.value() + 1
-            if new_value >= self.maximum():
-                new_value = 0
-            self.setValue(new_value)
+            QtGui.QPixmapCache.insert(pixmap_key, circle_pixmap)
 
+            return circle_pixmap
 
-class SplashDialog(dialog.Dialog(), object):
-    def __init__(self, parent=None, **kwargs):
-        super(SplashDialog, self).__init__(parent, use_artella_header=False, **kwargs)
+        def _sync_label_text(self, *args):
+            """
+            Internal function that updates the label with current progress text
+            """
 
-    def get_main_layout(self):
-        main_layout = QtWidgets.QVBoxLayout()
-        main_layout.setContentsMargins(10, 10, 10, 10)
-        main_layout.setSpacing(5)
+            self._default_label.setText(self.text())
 
-        return main_layout
+        def _on_progress_changed(self, *args):
+            """
+            Internal callback function that is called when progress value or range changes
+            """
 
-    def setup_ui(self):
-        super(SplashDialog, self).setup_ui()
+            # Same as utils.get_percent, inlined because this is called every time progress value changes
+            value, minimum, maximum = self.value(), self.minimum(), self.maximum()
+            if minimum == maximum:
+                self._percent = 100
+            else:
+                self._percent = int(max(0, min(100, (value - minimum) * 100 / (maximum - minimum))))
 
-        self.setWindowFlags(QtCore.Qt.Window | QtCore.Qt.FramelessWindowHint | QtCore.Qt.WA_DeleteOnClose)
-        self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
+            self._sync_label_text()
 
-        splash_pixmap = resource.pixmap('artella_splash')
-        splash = SplashScreen(splash_pixmap)
-        splash.setMask(splash_pixmap.mask())
-        self._splash_layout = QtWidgets.QVBoxLayout()
-        self._splash_layout.setAlignment(QtCore.Qt.AlignBottom)
-        splash.setLayout(self._splash_layout)
-        self.main_layout.addWidget(splash)
+        def _on_infinite_value_changed(self, value):
+            # Circle is drawn using integer percentages, so we only repaint it when the drawn percentage changes
+            repaint = int(value) != int(self._infinite_percent)
+            self._infinite_percent = value
+            if repaint:
+                self.update(self._circle_rect)
 
-        size_width = splash_pixmap.size().width() + 20
-        size_height = splash_pixmap.size().height() + 20
-        self.setFixedSize(QtCore.QSize(size_width, size_height))
+    class SplashDialog(dialog.Dialog(), object):
+        def __init__(self, parent=None, **kwargs):
 
-        shadow_effect = QtWidgets.QGraphicsDropShadowEffect(self)
-        shadow_effect.setBlurRadius(qtutils.dpi_scale(15))
-        shadow_effect.setColor(QtGui.QColor(0, 0, 0, 150))
-        shadow_effect.setOffset(qtutils.dpi_scale(0))
-        self.setGraphicsEffect(shadow_effect)
+            # Drop shadow is rendered by software, so short living splashes can disable it
+            self._enable_shadow = kwargs.pop('enable_shadow', True)
+            self._shadow_pixmap = None
 
+            super(SplashDialog, self).__init__(parent, use_artella_header=False, **kwargs)
 
-class InfoSplashDialog(SplashDialog, object):
-    def __init__(self, parent=None, **kwargs):
-        super(InfoSplashDialog, self).__init__(parent, **kwargs)
+        def get_main_layout(self):
+            main_layout = QtWidgets.QVBoxLayout()
+            main_layout.setContentsMargins(10, 10, 10, 10)
+            main_layout.setSpacing(5)
 
-    def setup_ui(self):
-        super(InfoSplashDialog, self).setup_ui()
+            return main_layout
 
-        self._progress_text = QtWidgets.QLabel('Wait please ...')
-        progress_text_layout = QtWidgets.QHBoxLayout()
-        progress_text_layout.addStretch()
-        progress_text_layout.addWidget(self._progress_text)
-        progress_text_layout.addStretch()
+        def setup_ui(self):
+            super(SplashDialog, self).setup_ui()
 
-        self._splash_layout.addLayout(progress_text_layout)
+            # Splash dialogs are never shown when DCC is executed in batch mode, so splash widgets are not created
+            self._has_ui = not dcc.is_batch()
+            if self._has_ui:
+                self.setup_splash_ui()
 
-    def set_text(self, text):
-        self._progress_text.setText(text)
+        def setup_splash_ui(self):
+            """
+            Function that creates splash widgets. Only called when splash dialogs can be shown.
+            """
 
+            self.setWindowFlags(QtCore.Qt.Window | QtCore.Qt.FramelessWindowHint | QtCore.Qt.WA_DeleteOnClose)
+            self.setAttribute(QtCore.Qt.WA_TranslucentBackground)
 
-class ProgressSplashDialog(SplashDialog, object):
-    def __init__(self, parent=None, **kwargs):
+            splash_pixmap = resource.pixmap('artella_splash')
+            splash = SplashScreen(splash_pixmap)
+            splash.setMask(_get_splash_mask(splash_pixmap))
+            self._splash_layout = QtWidgets.QVBoxLayout()
+            self._splash_layout.setAlignment(QtCore.Qt.AlignBottom)
+            splash.setLayout(self._splash_layout)
+            self.main_layout.addWidget(splash)
 
-        self._is_cancelled = False
+            size_width = splash_pixmap.size().width() + 20
+            size_height = splash_pixmap.size().height() + 20
+            self.setFixedSize(QtCore.QSize(size_width, size_height))
 
-        super(ProgressSplashDialog, self).__init__(parent, **kwargs)
+            # Splash pixmap never changes, so its drop shadow is rendered once and painted behind the splash instead
+            # of applying a graphics effect that blurs the whole dialog (progress animations included) on every paint
+            if self._enable_shadow and not splash_pixmap.isNull():
+                self._shadow_pixmap = _get_shadow_pixmap(splash_pixmap, qtutils.dpi_scale(15), 10)
 
-    def keyPressEvent(self, event):
-        pass
+        def paintEvent(self, event):
+            super(SplashDialog, self).paintEvent(event)
 
-        # if event.key() == QtCore.Qt.Key_Escape:
-        #     self._is_cancelled = True
-        # super(ProgressSplashDialog, self).keyPressEvent(event)
+            # Only the exposed region is painted, so progress updates only blit the small region behind the progress
+            if self._shadow_pixmap is not None:
+                exposed_rect = event.rect()
+                painter = QtGui.QPainter(self)
+                painter.drawPixmap(exposed_rect, self._shadow_pixmap, exposed_rect)
+                painter.end()
 
-    def setup_ui(self):
-        super(ProgressSplashDialog, self).setup_ui()
 
-        self._stack = stack.SlidingOpacityStackedWidget(parent=self)
-        self._splash_layout.addStretch()
-        self._splash_layout.addWidget(self._stack)
+    class InfoSplashDialog(SplashDialog, object):
+        def __init__(self, parent=None, **kwargs):
+            super(InfoSplashDialog, self).__init__(parent, **kwargs)
 
-        progress_widget = QtWidgets.QWidget(parent=self)
-        progress_layout = QtWidgets.QVBoxLayout()
-        progress_widget.setLayout(progress_layout)
-        self._progress = ProgressCricle()
-        progress_lyt = QtWidgets.QHBoxLayout()
-        progress_lyt.addStretch()
-        progress_lyt.addWidget(self._progress)
-        progress_lyt.addStretch()
-        self._progress_text = QtWidgets.QLabel('Wait please ...')
-        progress_txt_lyt = QtWidgets.QHBoxLayout()
-        progress_txt_lyt.addStretch()
-        progress_txt_lyt.addWidget(self._progress_text)
-        progress_txt_lyt.addStretch()
-        progress_layout.addStretch()
-        progress_layout.addLayout(progress_lyt)
-        progress_layout.addLayout(progress_txt_lyt)
+        def setup_splash_ui(self):
+            super(InfoSplashDialog, self).setup_splash_ui()
 
-        self._stack.addWidget(progress_widget)
+            self._progress_text = QtWidgets.QLabel('Wait please ...')
+            progress_text_layout = QtWidgets.QHBoxLayout()
+            progress_text_layout.addStretch()
+            progress_text_layout.addWidget(self._progress_text)
+            progress_text_layout.addStretch()
 
-    def set_progress_text(self, text):
-        self._progress.setFormat(text)
+            self._splash_layout.addLayout(progress_text_layout)
 
-    def set_infinite(self, flag):
-        self._progress.set_infinite(flag)
-        if flag:
-            self.set_progress_text('Please wait ...')
+        def set_text(self, text):
+            if not self._has_ui:
+                return
 
-    def start(self, reset=True, infinite=False):
+            self._progress_text.setText(text)
 
-        if dcc.is_batch():
-            self._log_progress()
-            return
 
-        if reset:
-            self._progress.setValue(0)
-            self._progress_text.setText('')
+    class ProgressSplashDialog(SplashDialog, object):
+        def __init__(self, parent=None, **kwargs):
+
+            self._is_cancelled = False
+
+            # Last progress value and status requested and not displayed yet
+            self._pending_progress = None
+
+            # Progress state used when splash widgets are not created (batch mode)
+            self._batch_progress = {'minimum': 0, 'maximum': 100, 'value': 0, 'status': ''}
 
-        self.set_infinite(infinite)
+            super(ProgressSplashDialog, self).__init__(parent, **kwargs)
 
-        self.exec_()
+        def keyPressEvent(self, event):
+            pass
 
-    def end(self):
-        self._log_progress()
-        self._progress.set_infinite(False)
+            # if event.key() == QtCore.Qt.Key_Escape:
+            #     self._is_cancelled = True
+            # super(ProgressSplashDialog, self).keyPressEvent(event)
+
+        def setup_splash_ui(self):
+            super(ProgressSplashDialog, self).setup_splash_ui()
+
+            self._stack = stack.SlidingOpacityStackedWidget(parent=self)
+            self._splash_layout.addStretch()
+            self._splash_layout.addWidget(self._stack)
+
+            progress_widget = QtWidgets.QWidget(parent=self)
+            progress_layout = QtWidgets.QVBoxLayout()
+            progress_widget.setLayout(progress_layout)
+            self._progress = ProgressCricle()
+            progress_lyt = QtWidgets.QHBoxLayout()
+            progress_lyt.addStretch()
+            progress_lyt.addWidget(self._progress)
+            progress_lyt.addStretch()
+            self._progress_text = QtWidgets.QLabel('Wait please ...')
+            progress_txt_lyt = QtWidgets.QHBoxLayout()
+            progress_txt_lyt.addStretch()
+            progress_txt_lyt.addWidget(self._progress_text)
+            progress_txt_lyt.addStretch()
+            progress_layout.addStretch()
+            progress_layout.addLayout(progress_lyt)
+            progress_layout.addLayout(progress_txt_lyt)
+
+            self._stack.addWidget(progress_widget)
+
+            # Progress can be updated many times per second (for example, once per downloaded chunk), so progress
+            # updates are coalesced and displayed, at most, once per frame
+            self._progress_timer = QtCore.QTimer(self)
+            self._progress_timer.setSingleShot(True)
+            self._progress_timer.setInterval(16)
+            self._progress_timer.timeout.connect(self._flush_progress)
+
+        def set_progress_text(self, text):
+            if not self._has_ui:
+                return
+
+            self._progress.setFormat(text)
 
-        if dcc.is_batch():
-            return
+        def set_infinite(self, flag):
+            if not self._has_ui:
+                return
 
-        self.fade_close()
+            self._progress.set_infinite(flag)
+            if flag:
+                self.set_progress_text('Please wait ...')
 
-    def get_min_progress_value(self):
-        return self._progress.minimum()
+        def start(self, reset=True, infinite=False):
 
-    def get_max_progress_value(self):
-        return self._progress.maximum()
+            if not self._has_ui:
+                self._log_progress()
+                return
 
-    def set_min_progress_value(self, min_value):
-        self._progress.setMinimum(min_value)
+            if reset:
+                self._pending_progress = None
+                self._progress_timer.stop()
+                self._progress.setValue(0)
+                self._progress_text.setText('')
 
-    def set_max_progress_value(self, max_value):
-        self._progress.setMaximum(max_value)
+            self.set_infinite(infinite)
 
-    def get_progress_value(self):
-        return self._progress.value()
+            self.exec_()
 
-    def set_progress_value(self, value, status=''):
-        if not self._progress.infinite:
-            self._progress.setValue(value)
-        self._progress_text.setText(str(status))
+        def end(self):
+            if not self._has_ui:
+                self._log_progress()
+                return
 
-    def is_cancelled(self):
-        return self._is_cancelled
+            self._flush_progress()
+            self._log_progress()
+            self._progress.set_infinite(False)
 
-    def _log_progress(self):
-        """
-         Internal function that logs current progress into DCC output window
-         """
+            self.fade_close()
 
-        logger.debug('{} - {}'.format(self._progress_text.text(), self._progress.value()))
+        def get_min_progress_value(self):
+            if not self._has_ui:
+                return self._batch_progress['minimum']
 
+            return self._progress.minimum()
 
-class DownloadSplashDialog(ProgressSplashDialog, object):
-    def __init__(self, downloader, parent=None, **kwargs):
-        super(DownloadSplashDialog, self).__init__(parent, **kwargs)
+        def get_max_progress_value(self):
+            if not self._has_ui:
+                return self._batch_progress['maximum']
 
-        self._downloader = downloader
-        self._file_items = dict()
+            return self._progress.maximum()
 
-    def setup_ui(self):
-        super(DownloadSplashDialog, self).setup_ui()
+        def set_min_progress_value(self, min_value):
+            if not self._has_ui:
+                self._batch_progress['minimum'] = min_value
+                return
 
-        main_widget = QtWidgets.QWidget()
-        main_layout = QtWidgets.QVBoxLayout()
-        main_widget.setLayout(main_layout)
-        self._stack.addWidget(main_widget)
+            self._progress.setMinimum(min_value)
 
-        download_widget = QtWidgets.QWidget()
-        download_layout = QtWidgets.QVBoxLayout()
-        download_widget.setLayout(download_layout)
-        content_area = QtWidgets.QScrollArea(parent=self)
-        content_area.setMinimumHeight(qtutils.dpi_scale(150))
-        content_area.setWidgetResizable(True)
-        content_area.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        # content_area.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
-        content_area.setWidget(download_widget)
-        content_area.setStyleSheet('background-color: transparent; border: none;')
-        self._download_layout = QtWidgets.QVBoxLayout()
-        download_layout.addLayout(self._download_layout)
+        def set_max_progress_value(self, max_value):
+            if not self._has_ui:
+                self._batch_progress['maximum'] = max_value
+                return
 
-        main_layout.addStretch()
-        main_layout.addWidget(content_area)
+            self._progress.setMaximum(max_value)
 
-    def download(self, file_paths):
-        if dcc.is_batch():
-            self._log_progress()
-            return
+        def get_progress_value(self):
+            if not self._has_ui:
+                return self._batch_progress['value']
+            if self._pending_progress is not None:
+                return self._pending_progress[0]
 
-        # qtutils.clear_layout(self._download_layout)
-        # self._file_items.clear()
-        # for file_path in file_paths:
-        #     file_path = utils.clean_path(file_path)
-        #     new_download_item = DownloadItemWidget(file_path, parent=self)
-        #     new_download_item.setVisible(False)
-        #     self._file_items[file_path] = new_download_item
-        #     self._download_layout.addWidget(new_download_item)
+            return self._progress.value()
 
-        self.exec_()
+        def set_progress_value(self, value, status=''):
+            if not self._has_ui:
+                self._batch_progress['value'] = value
+                self._batch_progress['status'] = str(status)
+                return
 
-    def update_download(self, file_path, status, progress):
+            self._pending_progress = (value, str(status))
+            if not self._progress_timer.isActive():
+                self._progress_timer.start()
 
-        pass
+        def is_cancelled(self):
+            return self._is_cancelled
 
-        # self._stack.setCurrentIndex(1)
-        #
-        # if not file_path or not self._file_items:
-        #     return
-        # file_path = utils.clean_path(file_path)
-        # if file_path not in self._file_items:
-        #     return
-        #
-        # download_item = self._file_items[file_path]
-        # download_item.set_status(status, progress)
-        # download_item.setVisible(True)
+        def _flush_progress(self):
+            """
+            Internal function that displays last requested progress value and status
+            """
 
+            if self._pending_progress is None:
+                return
 
-if qtutils.QT_AVAILABLE:
-    class DownloadItemWidget(QtWidgets.QWidget):
-        def __init__(self, file_path, parent=None):
-            super(DownloadItemWidget, self).__init__(parent)
-
-            download_layout = QtWidgets.QHBoxLayout()
-            self.setLayout(download_layout)
-
-            self._path_label = QtWidgets.QLabel(os.path.basename(file_path))
-            self._progress_text = QtWidgets.QLabel('Waiting ...')
-            self._progress = ProgressCricle(width=qtutils.dpi_scale(35))
-            # self._progress.setTextVisible(False)
-            download_layout.addWidget(self._progress)
-            download_layout.addWidget(self._path_label)
-            download_layout.addStretch()
-            download_layout.addWidget(self._progress_text)
-            download_layout.addStretch()
-
-            self._progress_text.setVisible(False)
-
-        def set_status(self, status, progress=None):
-            status = status or ''
-            self._progress_text.setText(str(status))
+            value, status = self._pending_progress
+            self._pending_progress = None
+            self._progress_timer.stop()
+
+            if not self._progress.infinite:
+                # Progress circle is only updated (and repainted) when its displayed percentage changes
+                minimum, maximum = self._progress.minimum(), self._progress.maximum()
+                percent = int(utils.get_percent(value, minimum, maximum))
+                current_percent = int(utils.get_percent(self._progress.value(), minimum, maximum))
+                if percent != current_percent or value in (minimum, maximum):
+                    self._progress.setValue(value)
+            if status != self._progress_text.text():
+                self._progress_text.setText(status)
+
+        def _log_progress(self):
+            """
+             Internal function that logs current progress into DCC output window
+             """
+
+            # Progress is logged on every progress update, so we avoid retrieving it if debug messages are not logged
+            if not logger.isEnabledFor(logging.DEBUG):
+                return
+
+            if self._has_ui:
+                logger.debug('{} - {}'.format(self._progress_text.text(), self._progress.value()))
+            else:
+                logger.debug('{} - {}'.format(self._batch_progress['status'], self._batch_progress['value']))
+
+
+    class DownloadSplashDialog(ProgressSplashDialog, object):
+
+        # Emitted by update_download. Downloads progress can be reported from the download thread, so the signal is
+        # used to display it in the UI thread.
+        download_updated = QtCore.Signal(str, str, int)
+
+        def __init__(self, downloader, parent=None, **kwargs):
+            super(DownloadSplashDialog, self).__init__(parent, **kwargs)
+
+            self._downloader = downloader
+
+            # Latest status and progress, per file path, not displayed yet
+            self._pending_downloads = dict()
+
+            self._download_thread = None
+            self._download_worker = None
+
+            self.download_updated.connect(self._on_download_updated)
+
+        def keyPressEvent(self, event):
+            if event.key() == QtCore.Qt.Key_Escape:
+                self._is_cancelled = True
+                if self._download_worker:
+                    # Worker thread is busy downloading, so a queued call would not be processed until download ends
+                    self._download_worker.cancel()
+                return
+
+            super(DownloadSplashDialog, self).keyPressEvent(event)
+
+        def setup_splash_ui(self):
+            super(DownloadSplashDialog, self).setup_splash_ui()
+
+            main_widget = QtWidgets.QWidget()
+            main_layout = QtWidgets.QVBoxLayout()
+            main_widget.setLayout(main_layout)
+            self._stack.addWidget(main_widget)
+
+            # Downloads are displayed by a view painting model rows, so no widgets are created per downloaded file
+            self._downloads_model = DownloadItemsModel(parent=self)
+            downloads_view = QtWidgets.QListView(parent=self)
+            downloads_view.setMinimumHeight(qtutils.dpi_scale(150))
+            downloads_view.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+            downloads_view.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+            downloads_view.setFocusPolicy(QtCore.Qt.NoFocus)
+            downloads_view.setUniformItemSizes(True)
+            downloads_view.setStyleSheet('background-color: transparent; border: none;')
+            downloads_view.setItemDelegate(DownloadItemDelegate(parent=downloads_view))
+            downloads_view.setModel(self._downloads_model)
+
+            main_layout.addStretch()
+            main_layout.addWidget(downloads_view)
+
+            # Downloads report their progress once per downloaded chunk, so download items are updated, at most, once
+            # per frame with the latest status of each file
+            self._downloads_timer = QtCore.QTimer(self)
+            self._downloads_timer.setSingleShot(True)
+            self._downloads_timer.setInterval(16)
+            self._downloads_timer.timeout.connect(self._flush_downloads)
+
+        def download(self, file_paths):
+            if not self._has_ui:
+                self._log_progress()
+                return
+
+            self._downloads_model.set_files([utils.clean_path(file_path) for file_path in file_paths])
+
+            # Files are downloaded in a separate thread, so splash dialog keeps processing events (paint, cancel, etc)
+            # while the downloader is waiting for I/O. Progress is reported to the dialog through queued signals.
+            # NOTE: Downloader is executed outside DCC main thread, so it must not call DCC APIs that are not thread
+            # safe (such as Maya cmds) directly.
+            self._download_thread = QtCore.QThread(self)
+            self._download_worker = DownloadWorker(self._downloader, file_paths)
+            self._download_worker.moveToThread(self._download_thread)
+            self._download_worker.progress_changed.connect(self._on_download_updated, QtCore.Qt.QueuedConnection)
+            self._download_worker.finished.connect(self._on_download_finished, QtCore.Qt.QueuedConnection)
+            self._download_thread.started.connect(self._download_worker.run)
+            self._download_thread.start()
+
+            self.exec_()
+
+        def update_download(self, file_path, status, progress):
+            """
+            Reports the download progress of a file. Can be called from any thread.
+            :param str file_path: path of the file being downloaded
+            :param str status: download status of the file
+            :param int progress: download progress of the file
+            """
+
+            self.download_updated.emit(file_path or '', status or '', int(progress))
+
+        def _on_download_updated(self, file_path, status, progress):
+            """
+            Internal callback function that is called, in the UI thread, when the download progress of a file changes
+            :param str file_path: path of the file being downloaded
+            :param str status: download status of the file
+            :param int progress: download progress of the file
+            """
+
+            if not self._has_ui or not file_path or not self._downloads_model.has_files():
+                return
+            file_path = utils.clean_path(file_path)
+            if not self._downloads_model.has_file(file_path):
+                return
+
+            self._pending_downloads[file_path] = (status, progress)
+            if not self._downloads_timer.isActive():
+                self._downloads_timer.start()
+
+        def _flush_downloads(self):
+            """
+            Internal function that displays the latest status of the downloads updated since last flush
+            """
+
+            if not self._pending_downloads:
+                return
+
+            pending_downloads = self._pending_downloads
+            self._pending_downloads = dict()
+
+            self._stack.setCurrentIndex(1)
+            for file_path, (status, progress) in pending_downloads.items():
+                self._downloads_model.set_status(file_path, status, progress)
+
+        def _on_download_finished(self):
+            """
+            Internal callback function that is called when download worker finishes downloading files
+            """
+
+            if self._download_thread:
+                self._download_thread.quit()
+                self._download_thread.wait()
+            self._download_thread = None
+            self._download_worker = None
+
+            self.end()
+
+    class DownloadWorker(QtCore.QObject, object):
+        """
+        Class that downloads files using an Artella downloader. It is moved into a worker thread, so downloads
+        do not block the UI thread.
+        """
+
+        progress_changed = QtCore.Signal(str, str, int)
+        finished = QtCore.Signal()
+
+        def __init__(self, downloader, file_paths, parent=None):
+            super(DownloadWorker, self).__init__(parent)
+
+            self._downloader = downloader
+            self._file_paths = file_paths
+            self._is_cancelled = False
+
+        def is_cancelled(self):
+            return self._is_cancelled
+
+        def cancel(self):
+            self._is_cancelled = True
+
+        def update_download(self, file_path, status, progress):
+            """
+            Reports the download progress of a file. Passed to the downloader as its progress callback, so it is called
+            from the worker thread.
+            :param str file_path: path of the file being downloaded
+            :param str status: download status of the file
+            :param int progress: download progress of the file
+            """
+
+            self.progress_changed.emit(file_path, status, int(progress))
+
+        def run(self):
+            """
+            Downloads the files. This function is executed in the worker thread.
+            Downloader reports progress through the worker and polls the worker to stop downloading once cancelled.
+            """
+
+            try:
+                if not self._is_cancelled:
+                    self._downloader.download(
+                        self._file_paths, show_dialogs=False, progress_callback=self.update_download,
+                        is_cancelled=self.is_cancelled)
+            except Exception as exc:
+                logger.error('Error while downloading files: {}'.format(exc))
+            finally:
+                self.finished.emit()
+
+    class DownloadItemsModel(QtCore.QAbstractListModel, object):
+        """
+        Model that stores the download status of files. Files are only listed once their download starts.
+        """
+
+        STATUS_ROLE = QtCore.Qt.UserRole + 1
+        PROGRESS_ROLE = QtCore.Qt.UserRole + 2
+
+        def __init__(self, parent=None):
+            super(DownloadItemsModel, self).__init__(parent)
+
+            self._files = set()
+            self._items = list()        # [file path, file name, status, progress] lists
+            self._rows = dict()         # Row of each listed file path
+
+        def rowCount(self, parent=QtCore.QModelIndex()):
+            if parent.isValid():
+                return 0
+
+            return len(self._items)
+
+        def data(self, index, role=QtCore.Qt.DisplayRole):
+            if not index.isValid() or index.row() >= len(self._items):
+                return None
+
+            item = self._items[index.row()]
+            if role == QtCore.Qt.DisplayRole:
+                return item[1]
+            elif role == QtCore.Qt.ToolTipRole:
+                return item[0]
+            elif role == self.STATUS_ROLE:
+                return item[2]
+            elif role == self.PROGRESS_ROLE:
+                return item[3]
+
+            return None
+
+        def has_files(self):
+            return bool(self._files)
+
+        def has_file(self, file_path):
+            return file_path in self._files
+
+        def set_files(self, file_paths):
+            """
+            Sets the files which download status can be displayed by the model
+            :param list(str) file_paths: paths of the files to download
+            """
+
+            self.beginResetModel()
+            self._files = set(file_paths)
+            self._items = list()
+            self._rows = dict()
+            self.endResetModel()
+
+        def set_status(self, file_path, status, progress=None):
+            """
+            Updates the download status of the given file. Only the row of the file is updated.
+            :param str file_path: path of the downloaded file
+            :param str status: download status of the file
+            :param int or None progress: download progress of the file
+            """
+
+            if file_path not in self._files:
+                return
+
+            status = str(status or '')
+            row = self._rows.get(file_path, None)
+            if row is None:
+                row = len(self._items)
+                self.beginInsertRows(QtCore.QModelIndex(), row, row)
+                self._items.append([file_path, os.path.basename(file_path), status, progress or 0])
+                self._rows[file_path] = row
+                self.endInsertRows()
+                return
+
+            item = self._items[row]
+            if status == item[2] and (progress is None or progress == item[3]):
+                return
+            item[2] = status
             if progress is not None:
-                self._progress.setValue(progress)
+                item[3] = progress
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index)
+
+    class DownloadItemDelegate(QtWidgets.QStyledItemDelegate, object):
+        """
+        Delegate that paints the download progress circle and the file name of download items
+        """
+
+        def __init__(self, parent=None):
+            super(DownloadItemDelegate, self).__init__(parent)
+
+            # Same circle geometry and pens used by progress circles, created once for all items
+            self._circle_width = int(qtutils.dpi_scale(35))
+            pen_width = max(1, int(3 * self._circle_width / 50.0))
+            self._radius = self._circle_width - pen_width - 1
+            arc_origin = pen_width // 2 + 1
+            self._arc_rect = QtCore.QRect(arc_origin, arc_origin, self._radius, self._radius)
+            self._background_path = _get_arc_path(self._arc_rect, 90, -360)
+            self._pen_background = QtGui.QPen()
+            self._pen_background.setWidth(pen_width)
+            self._pen_background.setColor(QtGui.QColor(80, 120, 110))
+            self._pen_background.setCapStyle(QtCore.Qt.RoundCap)
+            self._pen_foreground = QtGui.QPen()
+            self._pen_foreground.setWidth(pen_width)
+            self._pen_foreground.setColor(QtGui.QColor(221, 235, 230))
+            self._pen_foreground.setCapStyle(QtCore.Qt.RoundCap)
+            self._spacing = qtutils.dpi_scale(6)
+
+        def sizeHint(self, option, index):
+            return QtCore.QSize(option.rect.width(), self._circle_width + self._spacing)
+
+        def paint(self, painter, option, index):
+            progress = index.data(DownloadItemsModel.PROGRESS_ROLE) or 0
+            progress = max(0, min(100, progress))
+            rect = option.rect
+            circle_top = rect.top() + (rect.height() - self._circle_width) // 2
+
+            painter.save()
+            painter.setRenderHints(QtGui.QPainter.Antialiasing)
+
+            # Delegate paints every visible row, so painter functions are only looked up once per row
+            stroke_path = painter.strokePath
+            draw_text = painter.drawText
+
+            # Circle paths are built relative to the circle origin, so background path is shared by all rows
+            painter.translate(rect.left(), circle_top)
+            stroke_path(self._background_path, self._pen_background)
+            if progress:
+                stroke_path(_get_arc_path(self._arc_rect, 90, -progress * 3.6), self._pen_foreground)
+            painter.setPen(option.palette.color(QtGui.QPalette.Text))
+            draw_text(
+                QtCore.QRect(0, 0, self._circle_width, self._circle_width),
+                QtCore.Qt.AlignCenter, '{}%'.format(int(progress)))
+            painter.translate(-rect.left(), -circle_top)
+
+            text_rect = QtCore.QRect(rect)
+            text_rect.setLeft(rect.left() + self._circle_width + self._spacing)
+            draw_text(
+                text_rect, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, index.data(QtCore.Qt.DisplayRole) or '')
+
+            painter.restore()
@@ -8,24 +8,87 @@ Module that contains ArtellaDrive utils classes and functions
 from __future__ import print_function, division, absolute_import
 
 import os
+import re
 import sys
-import time
 import json
 import shutil
 import fnmatch
 import inspect
 import logging
+import weakref
+import threading
 import importlib
 import subprocess
 from functools import wraps
+from collections import OrderedDict
 
 try:
     from importlib.machinery import SourceFileLoader
 except ImportError:
     import imp
+try:
+    from os import scandir
+except ImportError:
+    scandir = None
+try:
+    from time import perf_counter
+except ImportError:
+    from time import time as perf_counter
 
 logger = logging.getLogger('artella')
 
+# Python version and OS platform do not change during the session, so we check them only once
+IS_PYTHON2 = sys.version_info[0] == 2
+IS_PYTHON3 = sys.version_info[0] == 3
+IS_WINDOWS = sys.platform.startswith('win')
+IS_MAC = sys.platform == 'darwin'
+IS_LINUX = 'linux' in sys.platform
+
+
+class BoundedDict(OrderedDict):
+    """
+    Dictionary that stores, at most, the given number of items. Once it is full, its oldest item is removed every time
+    a new item is added, so caches using it never lose all their items at once.
+    """
+
+    def __init__(self, max_size, *args, **kwargs):
+        self.max_size = max_size
+        super(BoundedDict, self).__init__(*args, **kwargs)
+
+    def __setitem__(self, key, value, *args, **kwargs):
+        if len(self) >= self.max_size and key not in self:
+            self.popitem(last=False)
+        super(BoundedDict, self).__setitem__(key, value, *args, **kwargs)
+
+
+# Cache used to store already cleaned paths
+_CLEAN_PATHS_CACHE = BoundedDict(4096)
+
+# Cache of debug strings prefixes of objects. Objects are weak referenced, so they are not kept alive by the cache
+_DEBUG_PREFIXES_CACHE = weakref.WeakKeyDictionary()
+
+# Folders with more files than this are deleted using multiple threads
+_PARALLEL_DELETE_MIN_FILES = 256
+_PARALLEL_DELETE_THREADS = 8
+_PARALLEL_DELETE_CHUNK_SIZE = 64
+
+# Whether or not files can be deleted relative to an open folder (unlinkat). Not available in Python 2 and Windows
+_UNLINK_SUPPORTS_DIR_FD = os.unlink in getattr(os, 'supports_dir_fd', set())
+
+# Cleaned Python paths (sys.path), and the Python paths they were cleaned from. They are cleaned again when sys.path
+# changes
+_CLEANED_SYS_PATHS = frozenset()
+_CLEANED_SYS_PATHS_SOURCE = None
+
+# Cache of module paths already converted to dotted paths. It is cleared when sys.path changes
+_DOTTED_PATHS_CACHE = BoundedDict(1024)
+
+# Metaclasses of singleton classes. Keys are the original metaclasses of the singleton classes
+_SINGLETON_METACLASSES = dict()
+
+# Cache of compiled file name patterns
+_FILE_PATTERNS_CACHE = BoundedDict(64)
+
 
 def is_python2():
     """
@@ -33,7 +96,7 @@ def is_python2():
     :return: bool
     """
 
-    return sys.version_info.major == 2
+    return IS_PYTHON2
 
 
 def is_python3():
@@ -42,7 +105,7 @@ def is_python3():
     :return: bool
     """
 
-    return sys.version_info.major == 3
+    return IS_PYTHON3
 
 
 def is_windows():
@@ -53,7 +116,7 @@ def is_windows():
     :rtype: bool
     """
 
-    return sys.platform.startswith('win')
+    return IS_WINDOWS
 
 
 def is_mac():
@@ -64,7 +127,7 @@ def is_mac():
     :rtype: bool
     """
 
-    return sys.platform == 'darwin'
+    return IS_MAC
 
 
 def is_linux():
@@ -75,19 +138,39 @@ def is_linux():
     :rtype: bool
     """
 
-    return 'linux' in sys.platform
+    return IS_LINUX
 
 
 def clean_path(path):
     """
     Returns a cleaned path to make sure that we do not have problems with path slashes
+    Cleaned paths are cached, so cleaning the same path again is a dictionary lookup.
+    :param str path: path we want to clean
+    :return: clean path
+    :rtype: str
+    """
+
+    try:
+        cleaned_path = _CLEAN_PATHS_CACHE.get(path, None)
+    except TypeError:
+        return _clean_path(path)
+
+    if cleaned_path is None:
+        cleaned_path = _CLEAN_PATHS_CACHE[path] = _clean_path(path)
+
+    return cleaned_path
+
+
+def _clean_path(path):
+    """
+    Internal function that cleans given path to make sure that we do not have problems with path slashes
     :param str path: path we want to clean
     :return: clean path
     :rtype: str
     """
 
     # Convert '~' Unix char to user's home directory and remove spaces and bad slashes
-    if is_python2():
+    if IS_PYTHON2:
         if isinstance(path, str):
             path = os.path.expanduser(path)
         else:
@@ -95,17 +178,16 @@ def clean_path(path):
                 path = os.path.expanduser(str(path.encode('utf-8')))
             except Exception:
                 path = os.path.expanduser(str(path.encode('latin1')))
-    path = str(path.replace('\\', '/').replace('//', '/').rstrip('/').strip())
 
-    # Fix server paths
-    is_server_path = path.startswith('\\')
-    while '\\' in path:
-        path = path.replace('\\', '//')
-    if is_server_path:
-        path = '//{}'.format(path)
+    # Most paths have no bad slashes, so they only need to be stripped
+    if '\\' not in path and '//' not in path:
+        return str(path.rstrip('/').strip())
+
+    # String replacements are done in C, so a few of them are faster than scanning the path character by character
+    path = str(path.replace('\\', '/').replace('//', '/').rstrip('/').strip())
 
     # Fix web paths
-    if not path.find('https://') > -1:
+    if 'https://' not in path:
         path = path.replace('//', '/')
 
     return path
@@ -124,7 +206,7 @@ def split_path(path, clean_drive=True):
     if clean_drive:
         path = os.path.splitdrive(path)[-1]
 
-    return [next(part for part in path.split(os.path.sep) if part)]
+    return [part for part in path.split(os.sep) if part]
 
 
 def clear_list(list_to_clear):
@@ -134,7 +216,7 @@ def clear_list(list_to_clear):
     :param list_to_clear: list
     """
 
-    if is_python2():
+    if IS_PYTHON2:
         del list_to_clear[:]
     else:
         list_to_clear.clear()
@@ -154,14 +236,16 @@ def force_list(var, remove_duplicates=False):
     if var is None:
         return list()
 
-    if type(var) is not list:
-        if type(var) in [tuple]:
-            var = list(var)
-        else:
-            var = [var]
+    var_type = type(var)
+    if var_type is tuple:
+        var = list(var)
+    elif var_type is not list:
+        var = [var]
 
+    # OrderedDict keeps insertion order in all supported Python versions (plain dictionaries only keep it in
+    # Python 3.7+), so duplicates are removed keeping the order of the elements
     if remove_duplicates:
-        var = list(set(var))
+        var = list(OrderedDict.fromkeys(var))
 
     return var
 
@@ -180,11 +264,53 @@ def get_files(root_folder, pattern='*'):
 
     files_found = list()
 
-    for dir_path, dir_names, file_names in os.walk(root_folder):
-        for file_name in fnmatch.filter(file_names, pattern):
-            files_found.append(clean_path(os.path.join(dir_path, file_name)))
+    # Same matching as fnmatch.filter, but pattern is only compiled once. Functions called per file are bound to
+    # locals, so they are not looked up again for each file
+    match = _compile_file_pattern(pattern)
+    normcase = os.path.normcase
+    add_file = files_found.append
+    clean = clean_path
+
+    if scandir is None:
+        join = os.path.join
+        for dir_path, dir_names, file_names in os.walk(root_folder):
+            for file_name in file_names:
+                if match(normcase(file_name)):
+                    add_file(clean(join(dir_path, file_name)))
+        return files_found
+
+    # Folder entries already know their type, so files and folders are found without calling stat on each entry
+    folders = [root_folder]
+    while folders:
+        try:
+            for entry in scandir(folders.pop()):
+                if entry.is_dir():
+                    # Same as os.walk, we do not follow folders symbolic links
+                    if not entry.is_symlink():
+                        folders.append(entry.path)
+                elif match(normcase(entry.name)):
+                    add_file(clean(entry.path))
+        except OSError:
+            continue
 
-    return list(set(files_found))
+    return files_found
+
+
+def _compile_file_pattern(pattern):
+    """
+    Internal function that returns the match function of the given file name pattern
+    :param str pattern: fnmatch pattern
+    :return: Match function of the compiled pattern
+    :rtype: callable
+    """
+
+    if pattern in _FILE_PATTERNS_CACHE:
+        return _FILE_PATTERNS_CACHE[pattern]
+
+    pattern_match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+    _FILE_PATTERNS_CACHE[pattern] = pattern_match
+
+    return pattern_match
 
 
 def get_file_size(file_path, round_value=2):
@@ -285,14 +411,6 @@ def delete_folder(folder_name, directory=None):
     :return: str, folder that was deleted with path
     """
 
-    def delete_read_only_error(action, name, exc):
-        """
-        Helper to delete read only files
-        """
-
-        os.chmod(name, 0o777)
-        action(name)
-
     full_path = folder_name
     if directory:
         full_path = clean_path(os.path.join(directory, folder_name))
@@ -300,13 +418,144 @@ def delete_folder(folder_name, directory=None):
         return None
 
     try:
-        shutil.rmtree(full_path, onerror=delete_read_only_error)
+        # Same as shutil.rmtree, contents of folders symbolic links are never deleted. Without scandir, folder
+        # contents are not retrieved, so shutil.rmtree is used.
+        if scandir is None or os.path.islink(full_path):
+            shutil.rmtree(full_path, onerror=_delete_read_only_error)
+        else:
+            # Folder hierarchy is only walked once. Small folders are deleted in the calling thread
+            folders_files, folders_paths = _get_folder_contents(full_path)
+            total_files = sum(len(file_names) for _, file_names in folders_files)
+            threads_count = _PARALLEL_DELETE_THREADS if total_files > _PARALLEL_DELETE_MIN_FILES else 1
+            _parallel_delete_folder(full_path, folders_files, folders_paths, threads_count=threads_count)
     except Exception as exc:
         logger.warning('Could not remove folder "{}" | {}'.format(full_path, exc))
 
     return full_path
 
 
+def _delete_read_only_error(action, name, exc):
+    """
+    Internal function used to delete read only files and folders. Used as shutil.rmtree error handler
+    :param callable action: function that failed
+    :param str name: path of the file or folder that could not be deleted
+    :param tuple exc: exception info
+    """
+
+    os.chmod(name, 0o777)
+    action(name)
+
+
+def _get_folder_contents(folder_path):
+    """
+    Internal function that returns all files and folders located inside given folder hierarchy
+    :param str folder_path: folder to retrieve contents of
+    :return: Tuple with the list of (folder path, files names) tuples (symbolic links are included as files) and
+        the list of folders paths. Folders are sorted so sub folders are listed before their parent folders.
+    :rtype: tuple(list(tuple(str, list(str))), list(str))
+    """
+
+    folders_files = list()
+    folders_paths = list()
+
+    # Without scandir we do not check folder contents
+    if scandir is None:
+        return folders_files, folders_paths
+
+    folders = [folder_path]
+    while folders:
+        current_folder = folders.pop()
+        folders_paths.append(current_folder)
+        file_names = list()
+        for entry in scandir(current_folder):
+            if entry.is_dir(follow_symlinks=False):
+                folders.append(entry.path)
+            else:
+                file_names.append(entry.name)
+        if file_names:
+            folders_files.append((current_folder, file_names))
+
+    # Folders are visited before their sub folders, so we reverse them to delete sub folders first
+    folders_paths.reverse()
+
+    return folders_files, folders_paths
+
+
+def _parallel_delete_folder(folder_path, folders_files, folders_paths, threads_count=_PARALLEL_DELETE_THREADS):
+    """
+    Internal function that deletes given folder using multiple threads. Deleting files is mostly waiting for the file
+    system, so files are deleted in parallel. Folders are deleted once they are empty.
+    :param str folder_path: folder to delete
+    :param list(tuple(str, list(str))) folders_files: folders of the folder hierarchy with the names of their files
+    :param list(str) folders_paths: paths of all folders inside the folder hierarchy, sub folders first
+    :param int threads_count: number of threads used to delete files. If 1, files are deleted in the calling thread
+    """
+
+    # Big folders are split, so files are evenly distributed between threads
+    delete_tasks = list()
+    for current_folder, file_names in folders_files:
+        for i in range(0, len(file_names), _PARALLEL_DELETE_CHUNK_SIZE):
+            delete_tasks.append((current_folder, file_names[i:i + _PARALLEL_DELETE_CHUNK_SIZE]))
+
+    errors = list()
+
+    def _delete_files(tasks):
+        try:
+            for task_folder, task_file_names in tasks:
+                _delete_folder_files(task_folder, task_file_names)
+        except Exception as exc:
+            errors.append(exc)
+
+    if threads_count > 1:
+        delete_threads = [
+            threading.Thread(target=_delete_files, args=(delete_tasks[i::threads_count],))
+            for i in range(threads_count)]
+        for delete_thread in delete_threads:
+            delete_thread.start()
+        for delete_thread in delete_threads:
+            delete_thread.join()
+    else:
+        _delete_files(delete_tasks)
+    if errors:
+        raise errors[0]
+
+    for path in folders_paths:
+        try:
+            os.rmdir(path)
+        except OSError:
+            _delete_read_only_error(os.rmdir, path, sys.exc_info())
+
+
+def _delete_folder_files(folder_path, file_names):
+    """
+    Internal function that deletes the files with given names located in given folder.
+    If the platform supports it, files are deleted relative to the folder (unlinkat), so the full path of each
+    file is not resolved again by the file system.
+    :param str folder_path: folder where files are located
+    :param list(str) file_names: names of the files to delete
+    """
+
+    folder_fd = None
+    if _UNLINK_SUPPORTS_DIR_FD:
+        try:
+            folder_fd = os.open(folder_path, os.O_RDONLY)
+        except OSError:
+            folder_fd = None
+
+    try:
+        for file_name in file_names:
+            try:
+                if folder_fd is None:
+                    os.unlink(os.path.join(folder_path, file_name))
+                else:
+                    os.unlink(file_name, dir_fd=folder_fd)
+            except OSError:
+                _delete_read_only_error(os.unlink, os.path.join(folder_path, file_name), sys.exc_info())
+    finally:
+        if folder_fd is not None:
+            os.close(folder_fd)
+
+
 def debug_object_string(obj, msg):
     """
     Returns a debug string depending of the type of the object
@@ -317,14 +566,42 @@ def debug_object_string(obj, msg):
     :rtype: str
     """
 
+    try:
+        prefix = _DEBUG_PREFIXES_CACHE.get(obj, None)
+    except TypeError:
+        # Object cannot be weak referenced
+        prefix = None
+
+    if prefix is None:
+        prefix = _get_debug_object_prefix(obj)
+        if prefix is None:
+            return None
+        try:
+            _DEBUG_PREFIXES_CACHE[obj] = prefix
+        except TypeError:
+            pass
+
+    return '%s%s' % (prefix, msg)
+
+
+def _get_debug_object_prefix(obj):
+    """
+    Internal function that returns the prefix of the debug strings of the given object
+    :param object obj: Python object
+    :return: debug string prefix or None if the object is not a module, class, method or function
+    :rtype: str or None
+    """
+
     if inspect.ismodule(obj):
-        return '[%s module] :: %s' % (obj.__name__, msg)
+        return '[%s module] :: ' % obj.__name__
     elif inspect.isclass(obj):
-        return '[%s.%s class] :: %s' % (obj.__module__, obj.__name__, msg)
+        return '[%s.%s class] :: ' % (obj.__module__, obj.__name__)
     elif inspect.ismethod(obj):
-        return '[%s.%s.%s method] :: %s' % (obj.im_class.__module__, obj.im_class.__name__, obj.__name__, msg)
+        return '[%s.%s.%s method] :: ' % (obj.im_class.__module__, obj.im_class.__name__, obj.__name__)
     elif inspect.isfunction(obj):
-        return '[%s.%s function] :: %s' % (obj.__module__, obj.__name__, msg)
+        return '[%s.%s function] :: ' % (obj.__module__, obj.__name__)
+
+    return None
 
 
 def import_module(module_path, name=None, skip_exceptions=False):
@@ -357,7 +634,7 @@ def import_module(module_path, name=None, skip_exceptions=False):
             module_path = clean_path(os.path.join(module_path, '__init__.py'))
             if not os.path.exists(module_path):
                 raise ValueError('Cannot find module path: "{}"'.format(module_path))
-        if is_python2():
+        if IS_PYTHON2:
             return imp.load_source(name, os.path.realpath(module_path))
         else:
             return SourceFileLoader(name, os.path.realpath(module_path)).load_module()
@@ -366,28 +643,41 @@ def import_module(module_path, name=None, skip_exceptions=False):
         return None
 
 
-def iterate_modules(path, exclude=None):
+def iterate_modules(path, exclude=None, extensions=('.py', '.pyc'), skip_private=False, packages_only=False):
     """
     Iterates all Python modules of the given path
     :param str path: folder path to iterate searching for Python modules
     :param list(str) exclude: list of files to exclude during the searching process
+    :param tuple(str) extensions: extensions of the module files to iterate
+    :param bool skip_private: whether or not private modules (starting with "_") and test modules (starting with
+        "test_") should be skipped
+    :param bool packages_only: whether or not sub folders that are not Python packages should be skipped, including
+        all their contents. Useful to avoid walking big folders (such as resources ones) when modules can only be
+        located inside packages hierarchies.
     :return: Iterator with all the found modules
     :rtype: iterator
     """
 
-    if not exclude:
-        exclude = list()
+    # Package modules are excluded with the rest of excluded modules, so each file only needs one set lookup
+    exclude = set(exclude or list())
+    exclude.add('__init__')
+    private_prefixes = ('_', 'test_')
+    splitext = os.path.splitext
+    join = os.path.join
 
-    _exclude = ['__init__.py', '__init__.pyc']
     for root, dirs, files in os.walk(path):
+        if packages_only:
+            dirs[:] = [d for d in dirs if os.path.isfile(join(root, d, '__init__.py'))]
         if '__init__.py' not in files:
             continue
         for f in files:
-            base_name = os.path.splitext(f)[0]
-            if f not in _exclude and base_name not in exclude:
-                module_path = clean_path(os.path.join(root, f))
-                if f.endswith('.py') or f.endswith('.pyc'):
-                    yield module_path
+            if not f.endswith(extensions):
+                continue
+            if skip_private and f.startswith(private_prefixes):
+                continue
+            if splitext(f)[0] in exclude:
+                continue
+            yield clean_path(join(root, f))
 
 
 def iterate_module_members(module_to_iterate, predicate=None):
@@ -422,20 +712,48 @@ def convert_module_path_to_dotted_path(path):
     :rtype: str
     """
 
+    sys_path = _get_cleaned_sys_paths()
+
+    dotted_path = _DOTTED_PATHS_CACHE.get(path, None)
+    if dotted_path is not None:
+        return dotted_path
+
     directory, file_path = os.path.split(path)
     directory = clean_path(directory)
     file_name = os.path.splitext(file_path)[0]
     package_path = [file_name]
-    sys_path = [clean_path(p) for p in sys.path]
     drive_letter = os.path.splitdrive(path)[0] + '\\'
     while directory not in sys_path:
         directory, name = os.path.split(directory)
         directory = clean_path(directory)
         if directory == drive_letter or name == '':
-            return ''
+            package_path = list()
+            break
         package_path.append(name)
+    dotted_path = '.'.join(reversed(package_path))
+
+    _DOTTED_PATHS_CACHE[path] = dotted_path
 
-    return '.'.join(reversed(package_path))
+    return dotted_path
+
+
+def _get_cleaned_sys_paths():
+    """
+    Internal function that returns the cleaned paths of sys.path. Paths are only cleaned again when sys.path changes.
+    When sys.path changes, cached dotted paths are also cleared.
+    :return: Set of cleaned Python paths
+    :rtype: frozenset(str)
+    """
+
+    global _CLEANED_SYS_PATHS, _CLEANED_SYS_PATHS_SOURCE
+
+    # Comparing paths is much cheaper than cleaning them again
+    if _CLEANED_SYS_PATHS_SOURCE != sys.path:
+        _CLEANED_SYS_PATHS_SOURCE = list(sys.path)
+        _CLEANED_SYS_PATHS = frozenset(clean_path(p) for p in _CLEANED_SYS_PATHS_SOURCE)
+        _DOTTED_PATHS_CACHE.clear()
+
+    return _CLEANED_SYS_PATHS
 
 
 def read_json(filename):
@@ -469,12 +787,14 @@ def timestamp(f):
     :param f: fn, function
     """
 
+    func_name = f.func_name if IS_PYTHON2 else f.__name__
+
     @wraps(f)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = perf_counter()
         res = f(*args, **kwargs)
-        func_name = f.func_name if is_python2() else f.__name__
-        logger.info('<{}> Elapsed time : {}'.format(func_name, time.time() - start_time))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('<{}> Elapsed time : {}'.format(func_name, perf_counter() - start_time))
         return res
     return wrapper
 
@@ -484,10 +804,12 @@ def abstract(fn):
     Decorator that indicates that decorated function should be override
     """
 
+    # Decorated function never changes, so error message is built once, when the function is decorated
+    msg = debug_object_string(fn, 'DCC Abstract function {} has not been overridden.'.format(fn))
+
     @wraps(fn)
     def wrapper(*args, **kwargs):
-        msg = 'DCC Abstract function {} has not been overridden.'.format(fn)
-        raise NotImplementedError(debug_object_string(fn, msg))
+        raise NotImplementedError(msg)
 
     return wrapper
 
@@ -518,27 +840,79 @@ def add_metaclass(metaclass):
 
 class Singleton(object):
     """
-    Implements Singleton pattern design as a class decorator in Python
+    Implements Singleton pattern design as a class decorator in Python.
+    Decorated classes store their instance, so once the instance is created, retrieving it does not need to go through
+    any wrapper object. Decorated classes still provide the instance, cls and destroy attributes of the old wrapper
+    objects. Note that all_instances contains the decorated classes instead of wrapper objects.
     """
 
-    all_instances = list()
+    # Singleton classes are weak referenced, so classes that are not used anymore (for example, after reloading
+    # their modules) are not kept alive
+    all_instances = weakref.WeakSet()
+
+    def __new__(cls, singleton_class):
+        singleton_class = add_metaclass(_get_singleton_metaclass(type(singleton_class)))(singleton_class)
+        singleton_class._singleton_instance = None
+        cls.all_instances.add(singleton_class)
+
+        return singleton_class
 
     @staticmethod
     def destroy_all():
-        for instance in Singleton.all_instances:
-            instance.destroy()
+        for singleton_class in list(Singleton.all_instances):
+            Singleton.destroy(singleton_class)
+
+    @staticmethod
+    def destroy(singleton_class):
+        """
+        Removes the instance of the given singleton class, so a new instance is created next time the class is called
+        :param type singleton_class: class decorated with Singleton
+        """
+
+        singleton_class._singleton_instance = None
+
+
+def _get_singleton_metaclass(metaclass):
+    """
+    Internal function that returns the metaclass used by singleton classes which original metaclass is the given one.
+    Singleton metaclasses inherit from the original metaclass, so classes with custom metaclasses (such as Qt
+    classes) can be singletons too.
+    :param type metaclass: original metaclass of the singleton class
+    :return: Singleton metaclass
+    :rtype: type
+    """
+
+    singleton_metaclass = _SINGLETON_METACLASSES.get(metaclass, None)
+    if singleton_metaclass is not None:
+        return singleton_metaclass
+
+    def __call__(cls, *args, **kwargs):
+        # Instance is looked up in the class dictionary, so sub classes of singletons have their own instance
+        instance = cls.__dict__.get('_singleton_instance', None)
+        if instance is None:
+            instance = metaclass.__call__(cls, *args, **kwargs)
+            cls._singleton_instance = instance
+
+        return instance
+
+    # Singleton classes used to be wrapped by Singleton instances, so wrapper attributes (instance, cls and destroy)
+    # are still available in singleton classes for backwards compatibility
+    def _get_instance(cls):
+        return cls.__dict__.get('_singleton_instance', None)
 
-    def __init__(self, cls):
-        self.cls = cls
-        self.instance = None
-        self.all_instances.append(self)
+    def _set_instance(cls, instance):
+        cls._singleton_instance = instance
 
-    def destroy(self):
-        del self.instance
-        self.instance = None
+    def destroy(cls):
+        cls._singleton_instance = None
 
-    def __call__(self, *args, **kwargs):
-        if self.instance is None:
-            self.instance = self.cls(*args, **kwargs)
+    singleton_metaclass = type(metaclass)(
+        'Singleton{}'.format(metaclass.__name__), (metaclass,), {
+            '__call__': __call__,
+            'instance': property(_get_instance, _set_instance),
+            'cls': property(lambda cls: cls),
+            'destroy': destroy
+        })
+    _SINGLETON_METACLASSES[metaclass] = singleton_metaclass
 
-        return self.instance
+    return singleton_metaclass
@@ -32,7 +32,7 @@ def is_standalone():
     :return: bool
     """
 
-    return not any(pkg in list(main.__dict__.keys()) for pkg in Dccs.packages)
+    return not any(pkg in main.__dict__ for pkg in Dccs.packages)
 
 
 def is_maya():
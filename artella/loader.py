@@ -14,6 +14,9 @@ import logging.config
 from artella import dcc
 from artella.core import consts, utils, client, resource, plugins, dccplugin, dcc as dcc_core
 
+# Root folder of Artella package. It does not change during a session, so it is only resolved once
+_ARTELLA_PATH = os.path.dirname(os.path.abspath(__file__))
+
 
 def create_logger():
     """
@@ -35,7 +38,7 @@ def register_dcc_paths(dcc_paths=None):
     dccs_path = utils.force_list(dcc_paths)
     valid_dcc_paths = list()
     dcc_paths_str = ''
-    default_dccs_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dccs')
+    default_dccs_path = os.path.join(_ARTELLA_PATH, 'dccs')
     dccs_path.append(default_dccs_path)
     for dcc_path in dccs_path:
         if os.path.isdir(dcc_path):
@@ -100,14 +103,14 @@ def init(
     extensions.extend(dcc_extensions)
 
     # Initialize resources and theme
-    resource.register_resources_path(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources'))
+    resource.register_resources_path(os.path.join(_ARTELLA_PATH, 'resources'))
 
     # Create Artella Drive Client
     artella_drive_client = client.ArtellaDriveClient.get(extensions=extensions) if init_client else None
 
     # Load Plugins
     if load_plugins:
-        default_plugins_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'plugins')
+        default_plugins_path = os.path.join(_ARTELLA_PATH, 'plugins')
         if default_plugins_path not in plugins_path:
             plugins_path.append(default_plugins_path)
         plugins.register_paths(plugin_paths)
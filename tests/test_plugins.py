@@ -0,0 +1,80 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for Artella Plugins manager
+"""
+
+import os
+import json
+
+from artella.core import consts, utils, plugins
+
+
+def _create_plugin(plugin_root, plugin_id):
+    os.makedirs(plugin_root)
+    with open(os.path.join(plugin_root, consts.ARTELLA_PLUGIN_CONFIG), 'w') as config_file:
+        json.dump({'id': plugin_id}, config_file)
+
+
+def test_manifest_cache_finds_nested_plugins_added_later(tmpdir):
+    plugin_path = utils.clean_path(str(tmpdir))
+    _create_plugin(os.path.join(plugin_path, 'group', 'plug1'), 'plug1')
+
+    manifest_cache = dict()
+    plugin_manifests, cache_updated = plugins._get_cached_manifests(plugin_path, manifest_cache)
+    assert cache_updated
+    assert sorted(config[2]['id'] for config in plugin_manifests.values()) == ['plug1']
+
+    plugin_manifests, cache_updated = plugins._get_cached_manifests(plugin_path, manifest_cache)
+    assert not cache_updated
+
+    _create_plugin(os.path.join(plugin_path, 'group', 'plug2'), 'plug2')
+
+    plugin_manifests, cache_updated = plugins._get_cached_manifests(plugin_path, manifest_cache)
+    assert cache_updated
+    assert sorted(config[2]['id'] for config in plugin_manifests.values()) == ['plug1', 'plug2']
+
+
+def test_manifest_cache_keeps_other_plugin_paths(tmpdir, monkeypatch):
+    cache_path = str(tmpdir.join('cache', consts.ARTELLA_PLUGINS_CACHE))
+    monkeypatch.setattr(plugins, '_get_manifest_cache_path', lambda: cache_path)
+
+    first_path = utils.clean_path(str(tmpdir.mkdir('first')))
+    second_path = utils.clean_path(str(tmpdir.mkdir('second')))
+    _create_plugin(os.path.join(first_path, 'plug1'), 'plug1')
+    _create_plugin(os.path.join(second_path, 'plug2'), 'plug2')
+
+    manifest_cache = plugins._load_manifest_cache()
+    plugins._get_cached_manifests(first_path, manifest_cache)
+    assert plugins._save_manifest_cache(manifest_cache)
+
+    manifest_cache = plugins._load_manifest_cache()
+    plugins._get_cached_manifests(second_path, manifest_cache)
+    assert plugins._save_manifest_cache(manifest_cache)
+
+    manifest_cache = plugins._load_manifest_cache()
+    assert sorted(manifest_cache.keys()) == sorted([first_path, second_path])
+    assert not plugins._get_cached_manifests(first_path, manifest_cache)[1]
+    assert os.listdir(os.path.dirname(cache_path)) == [consts.ARTELLA_PLUGINS_CACHE]
+
+
+def test_plugin_module_is_found_inside_packages_only(tmpdir):
+    plugin_path = tmpdir.mkdir('plugin')
+    plugin_package = plugin_path.mkdir('artella').mkdir('plugins').mkdir('myplugin')
+    for package_path in (plugin_path.join('artella'), plugin_path.join('artella', 'plugins'), plugin_package):
+        package_path.join('__init__.py').write('')
+    plugin_package.join('plugin.py').write('')
+
+    # Python files inside folders that are not packages are never plugin modules
+    resources_package = plugin_package.mkdir('resources').mkdir('scripts')
+    resources_package.join('__init__.py').write('')
+    resources_package.join('script.py').write('')
+
+    plugin_modules = list(utils.iterate_modules(
+        str(plugin_path), extensions=('.py',), skip_private=True, packages_only=True))
+    assert plugin_modules == [utils.clean_path(str(plugin_package.join('plugin.py')))]
+
+    sub_module, module_path = plugins._get_plugin_module_path(utils.clean_path(str(plugin_path)))
+    assert sub_module == utils.clean_path(str(plugin_package.join('plugin.py')))
+    assert module_path == 'artella.plugins.myplugin.plugin'
@@ -0,0 +1,118 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for Artella utils
+"""
+
+import os
+
+from artella.core import utils
+
+
+def test_force_list_remove_duplicates_keeps_order():
+    assert utils.force_list([3, 1, 3, 2, 10, 5, 'b', 'a'], True) == [3, 1, 2, 10, 5, 'b', 'a']
+    assert utils.force_list((2, 1, 2), remove_duplicates=True) == [2, 1]
+    assert utils.force_list(None) == list()
+    assert utils.force_list('a') == ['a']
+
+
+def test_clean_path():
+    # Paths without bad slashes
+    assert utils.clean_path('/projects/asset/model.ma') == '/projects/asset/model.ma'
+    assert utils.clean_path('/projects/asset/') == '/projects/asset'
+    assert utils.clean_path(' /projects/asset ') == '/projects/asset'
+
+    # Paths with bad slashes
+    assert utils.clean_path('C:\\projects\\asset\\') == 'C:/projects/asset'
+    assert utils.clean_path('/projects//asset//model.ma') == '/projects/asset/model.ma'
+    assert utils.clean_path('C:\\projects/asset\\\\model.ma') == 'C:/projects/asset/model.ma'
+
+
+def test_split_path():
+    sep = os.sep
+    assert utils.split_path(sep.join(['', 'projects', 'asset', '', 'model.ma'])) == ['projects', 'asset', 'model.ma']
+    assert utils.split_path(sep.join(['projects', 'asset']))[0] == 'projects'
+    assert utils.split_path('') == list()
+
+
+def test_singleton():
+
+    @utils.Singleton
+    class TestSingleton(object):
+        def __init__(self, value=None):
+            self.value = value
+
+    instance = TestSingleton(1)
+    assert isinstance(instance, TestSingleton)
+    assert TestSingleton(2) is instance
+    assert instance.value == 1
+    assert TestSingleton in utils.Singleton.all_instances
+
+    # Sub classes have their own instance
+    class TestSubSingleton(TestSingleton):
+        pass
+
+    sub_instance = TestSubSingleton(3)
+    assert sub_instance is not instance
+    assert TestSubSingleton() is sub_instance
+    assert TestSingleton() is instance
+
+    utils.Singleton.destroy(TestSingleton)
+    new_instance = TestSingleton(4)
+    assert new_instance is not instance
+    assert new_instance.value == 4
+
+    utils.Singleton.destroy_all()
+    assert TestSingleton() is not new_instance
+
+
+def test_singleton_wrapper_attributes():
+
+    @utils.Singleton
+    class TestSingleton(object):
+        pass
+
+    assert TestSingleton.instance is None
+    assert TestSingleton.cls is TestSingleton
+
+    instance = TestSingleton()
+    assert TestSingleton.instance is instance
+
+    TestSingleton.destroy()
+    assert TestSingleton.instance is None
+    assert TestSingleton() is not instance
+
+
+def test_read_json_returns_independent_data(tmpdir):
+    json_path = str(tmpdir.join('config.json'))
+    with open(json_path, 'w') as json_file:
+        json_file.write('{"menu": {"label": "Artella"}}')
+
+    data = utils.read_json(json_path)
+    data['menu']['label'] = 'Modified'
+    assert utils.read_json(json_path) == {'menu': {'label': 'Artella'}}
+
+
+def test_bounded_dict_removes_oldest_items():
+    bounded_dict = utils.BoundedDict(2)
+    bounded_dict['a'] = 1
+    bounded_dict['b'] = 2
+    bounded_dict['a'] = 3
+    assert list(bounded_dict.items()) == [('a', 3), ('b', 2)]
+
+    bounded_dict['c'] = 4
+    assert list(bounded_dict.items()) == [('b', 2), ('c', 4)]
+
+
+def test_delete_folder(tmpdir):
+    folder_path = tmpdir.mkdir('folder')
+    folder_path.mkdir('empty')
+    sub_folder = folder_path.mkdir('sub')
+    for i in range(5):
+        sub_folder.join('file{}.txt'.format(i)).write('data')
+    folder_path.join('file.txt').write('data')
+
+    assert utils.delete_folder('folder', directory=str(tmpdir)) == utils.clean_path(str(folder_path))
+    assert not os.path.exists(str(folder_path))
+    assert utils.delete_folder('folder', directory=str(tmpdir)) is None